@@ -1,14 +1,15 @@
 """Main application class for Dictator."""
 
 import logging
-import os
 import signal
 import sys
-import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
 
 from .audio_recorder import AudioRecorder
-from .constants import AUDIO_FILE_PATH, LOCKFILE_PATH
-from .exceptions import DictatorError, TranscriptionError
+from .constants import AUDIO_FILE_PATH, CAPTURE_CHECK_INTERVAL, LOCKFILE_PATH
+from .exceptions import DictatorError, RecordingError, TranscriptionError
 from .process_manager import ProcessManager
 
 logger = logging.getLogger(__name__)
@@ -17,13 +18,14 @@ logger = logging.getLogger(__name__)
 class DictatorApp:
     """Main application class for Dictator."""
 
-    def __init__(self, backend: str = "deepgram"):
+    def __init__(self, backend: str = "deepgram", keep_audio_file: bool = False):
         # Store backend for lazy initialization
         self.backend = backend
 
         # Essential components for recording startup
         self.process_manager = ProcessManager(LOCKFILE_PATH)
-        self.recorder = AudioRecorder(AUDIO_FILE_PATH)
+        # Audio is transcribed from memory; the WAV file is only kept on request
+        self.recorder = AudioRecorder(AUDIO_FILE_PATH if keep_audio_file else None)
 
         # Components that will be lazily initialized
         self.transcription_service = None
@@ -34,6 +36,8 @@ class DictatorApp:
         self._system_tray_initialized = False
         self.llm_processor = None
         self._llm_processor_initialized = False
+        self._prewarm_thread = None
+        self.streaming_session = None
 
         self._setup_signal_handlers()
 
@@ -45,10 +49,13 @@ class DictatorApp:
 
                 self.transcription_service = create_transcription_backend(self.backend)
             except Exception as e:
+                # Left uninitialized so a failed pre-warm is retried, and
+                # reported, when the transcript is actually needed
                 logger.error(f"Failed to initialize transcription service: {e}")
-                raise
-            finally:
-                self._transcription_initialized = True
+                raise TranscriptionError(
+                    f"Failed to initialize transcription service: {e}"
+                ) from e
+            self._transcription_initialized = True
 
         return self.transcription_service
 
@@ -98,6 +105,97 @@ class DictatorApp:
 
         return self.llm_processor
 
+    def _prewarm_components(self) -> None:
+        """Initialize post-recording components while the user is still speaking."""
+        try:
+            transcription_service = self._get_transcription_service()
+            self._start_streaming_session(transcription_service)
+        except Exception as e:
+            logger.warning(f"Transcription service pre-warm failed: {e}")
+
+        try:
+            self._get_text_typer()
+        except Exception as e:
+            logger.warning(f"Text typer pre-warm failed: {e}")
+
+        self._get_llm_processor()
+
+        logger.info("Post-recording components pre-warmed")
+
+    def _start_streaming_session(self, transcription_service) -> None:
+        """Start live transcription of the ongoing recording, if supported."""
+        session = transcription_service.create_streaming_session()
+        if not session:
+            return
+
+        try:
+            session.start()
+        except TranscriptionError as e:
+            logger.warning(f"Live transcription unavailable, will upload audio: {e}")
+            return
+
+        if self.recorder.attach_audio_listener(session.send_audio):
+            self.streaming_session = session
+            logger.info("Streaming audio to live transcription")
+        else:
+            session.close()
+
+    def _finish_streaming_session(self) -> Optional[str]:
+        """Get the transcript from the live session, or None to fall back to upload."""
+        session = self.streaming_session
+        if not session:
+            return None
+
+        self.streaming_session = None
+        try:
+            return session.finish()
+        except TranscriptionError as e:
+            logger.warning(f"Live transcription failed, uploading audio instead: {e}")
+            return None
+
+    def _save_audio_in_background(
+        self, executor: ThreadPoolExecutor, audio_data: bytes
+    ) -> Optional[Future]:
+        """Write the WAV file, if requested, while transcription is under way."""
+        if not self.recorder.audio_file_path:
+            return None
+        return executor.submit(self.recorder.save_wav_file, audio_data)
+
+    def _detect_window_in_background(
+        self, executor: ThreadPoolExecutor
+    ) -> Optional[Future]:
+        """Look up the focused window for LLM context, if post-processing is on."""
+        llm_processor = self._get_llm_processor()
+        if not (llm_processor and llm_processor.is_enabled()):
+            return None
+        return executor.submit(llm_processor.get_window_info)
+
+    def _warm_llm_connection_in_background(self, executor: ThreadPoolExecutor) -> None:
+        """Open the LLM API connection while the transcript is being finalized.
+
+        Done at stop time rather than during recording, since an idle pooled
+        connection expires after a few seconds.
+        """
+        llm_processor = self._get_llm_processor()
+        if llm_processor and llm_processor.is_enabled():
+            executor.submit(llm_processor.warm_up_connection)
+
+    def _wait_for_audio_save(self, save_future: Optional[Future]) -> None:
+        """Wait for the background WAV write and report failures."""
+        if not save_future:
+            return
+
+        try:
+            save_future.result()
+        except RecordingError as e:
+            logger.error(f"Failed to save audio file: {e}")
+
+    def _wait_for_prewarm(self) -> None:
+        """Wait for background pre-warming so components are not initialized twice."""
+        if self._prewarm_thread and self._prewarm_thread.is_alive():
+            logger.info("Waiting for component pre-warm to finish")
+            self._prewarm_thread.join()
+
     def _setup_signal_handlers(self) -> None:
         """Setup signal handlers for graceful shutdown."""
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -112,6 +210,11 @@ class DictatorApp:
         """Start recording session."""
         logger.info("Starting begin command")
 
+        # Block stop signals before any thread starts so every thread inherits
+        # the mask and they stay pending until the main thread collects them
+        stop_signals = {signal.SIGTERM, signal.SIGINT}
+        signal.pthread_sigmask(signal.SIG_BLOCK, stop_signals)
+
         try:
             # Start recording ASAP - only essential components
             self.process_manager.create_lockfile()
@@ -128,9 +231,29 @@ class DictatorApp:
                     f"System tray initialization failed, continuing without it: {e}"
                 )
 
-            # Keep running until signal received
+            # Use recording time to pay SDK import and client setup costs
+            self._prewarm_thread = threading.Thread(
+                target=self._prewarm_components, daemon=True
+            )
+            self._prewarm_thread.start()
+
+            # Park in the kernel until a stop signal arrives. sigtimedwait is
+            # missing on macOS, where we simply block on sigwait instead
+            if not hasattr(signal, "sigtimedwait"):
+                self._signal_handler(signal.sigwait(stop_signals), None)
+                return
+
+            # Wake now and then to notice a capture stream that died
+            # (e.g. device removed)
             while True:
-                signal.pause()
+                siginfo = signal.sigtimedwait(stop_signals, CAPTURE_CHECK_INTERVAL)
+                if siginfo is not None:
+                    self._signal_handler(siginfo.si_signo, None)
+                    break
+                if not self.recorder.is_capturing():
+                    logger.error("Audio capture stopped unexpectedly, finishing early")
+                    self._cleanup_and_exit()
+                    break
 
         except DictatorError as e:
             logger.error(f"Recording error: {e}")
@@ -146,21 +269,20 @@ class DictatorApp:
         """Stop recording and transcribe."""
         logger.info("Starting end command")
 
-        pid = self.process_manager.get_running_pid()
-        if not pid:
-            logger.warning("No running recording process found")
-            return
-
         try:
-            logger.info(f"Sending stop signal to process {pid}")
-            os.kill(pid, signal.SIGTERM)
-            logger.info("Stop signal sent successfully")
-        except ProcessLookupError:
-            logger.warning(f"Process {pid} no longer exists")
+            pid = self.process_manager.signal_running_process(signal.SIGTERM)
         except PermissionError:
-            logger.error(f"No permission to signal process {pid}")
+            logger.error("No permission to signal the recording process")
+            return
         except OSError as e:
             logger.error(f"Error sending signal: {e}")
+            return
+
+        if not pid:
+            logger.warning("No running recording process found")
+            return
+
+        logger.info(f"Stop signal sent successfully to process {pid}")
 
     def _cleanup_and_exit(self) -> None:
         """Cleanup resources and exit."""
@@ -169,21 +291,32 @@ class DictatorApp:
         # Stop recording and get audio data from memory
         audio_data = self.recorder.stop_recording()
 
-        # Log memory buffer info
+        # Disk write overlaps pre-warm and upload instead of delaying them
+        executor = ThreadPoolExecutor(max_workers=3)
+        save_future = self._save_audio_in_background(executor, audio_data)
+
+        self._wait_for_prewarm()
+
         memory_size = len(audio_data)
 
-        # Check if WAV file was created
-        exists, file_size = self.recorder.get_file_info()
+        if memory_size > 0:
+            # Window detection does not depend on the transcript, so run it
+            # while the transcript is still being finalized
+            window_future = self._detect_window_in_background(executor)
+            self._warm_llm_connection_in_background(executor)
 
-        if exists and file_size > 0:
             try:
                 # Update tray to transcribing state (if available)
                 if self._system_tray_initialized and self.system_tray:
                     self.system_tray.set_transcribing_state()
 
-                logger.info(f"Starting transcription of {file_size} byte WAV file...")
-                transcription_service = self._get_transcription_service()
-                transcript = transcription_service.transcribe_file(AUDIO_FILE_PATH)
+                transcript = self._finish_streaming_session()
+                if transcript is None:
+                    logger.info(
+                        f"Starting transcription of {memory_size} bytes of WAV data..."
+                    )
+                    transcription_service = self._get_transcription_service()
+                    transcript = transcription_service.transcribe_audio(audio_data)
 
                 if transcript:
                     logger.info(
@@ -199,8 +332,9 @@ class DictatorApp:
                             self.system_tray.set_processing_state()
 
                         # Use streaming processing that types as it generates
+                        window_info = window_future.result() if window_future else None
                         llm_processor.process_transcript_streaming(
-                            transcript, text_typer
+                            transcript, text_typer, window_info
                         )
                         # Flush any remaining buffered content (discards trailing newlines)
                         text_typer.flush_remaining_content()
@@ -212,14 +346,14 @@ class DictatorApp:
 
             except TranscriptionError as e:
                 logger.error(f"Transcription failed: {e}")
-        elif memory_size > 0:
-            logger.warning(
-                f"Had {memory_size} bytes in memory but WAV file creation failed"
-            )
         else:
             logger.warning("No audio data recorded")
 
         # Cleanup
+        self._wait_for_audio_save(save_future)
+        executor.shutdown()
+        if self.streaming_session:
+            self.streaming_session.close()
         self.process_manager._cleanup_lockfile()
         if self._system_tray_initialized and self.system_tray:
             self.system_tray.stop()
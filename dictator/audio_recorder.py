@@ -1,136 +1,260 @@
 """Cross-platform audio recording functionality using PyAudio."""
 
+import atexit
 import io
 import logging
+import os
+import struct
 import threading
-import time
-import wave
 from pathlib import Path
-from typing import Optional
-
-import pyaudio
-
-from .constants import CHANNELS, SAMPLE_RATE
+from typing import TYPE_CHECKING, Callable, ClassVar, Optional
+
+from .constants import (
+    AUDIO_BUFFER_MS,
+    CAPTURE_THREAD_NICE,
+    CAPTURE_THREAD_RT_PRIORITY,
+    CHANNELS,
+    SAMPLE_RATE,
+)
 from .exceptions import RecordingError
 
+if TYPE_CHECKING:
+    import pyaudio
+
 logger = logging.getLogger(__name__)
 
+# Canonical 44-byte RIFF/WAVE header for uncompressed PCM
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+_SAMPLE_WIDTH = 2  # 16-bit = 2 bytes
+
 
 class AudioRecorder:
     """Handles cross-platform audio recording using PyAudio."""
 
-    def __init__(self, audio_file_path: Path):
+    # One PortAudio session per process; host API enumeration is expensive
+    _pa_instance: ClassVar[Optional["pyaudio.PyAudio"]] = None
+
+    def __init__(self, audio_file_path: Optional[Path] = None):
+        # WAV data is only written to disk when a path is given
         self.audio_file_path = audio_file_path
         self.audio_buffer = io.BytesIO()
-        self.recording_thread: Optional[threading.Thread] = None
+        self.audio_listener: Optional[Callable[[bytes], None]] = None
+        self._buffer_lock = threading.Lock()
+        self._priority_raised = False
         self.is_recording = False
-        self.audio_instance: Optional[pyaudio.PyAudio] = None
-        self.stream: Optional[pyaudio.Stream] = None
-        self.chunk_size = 1024  # Number of frames per buffer
+        # Per-recording values bound once so the capture callback avoids lookups
+        self._write_frames: Optional[Callable[[bytes], None]] = None
+        self._callback_result = (None, 0)
+        self.audio_instance: Optional["pyaudio.PyAudio"] = None
+        self.stream: Optional["pyaudio.Stream"] = None
+        # Number of frames per buffer
+        self.chunk_size = SAMPLE_RATE * AUDIO_BUFFER_MS // 1000
 
     def start_recording(self) -> None:
         """Start audio recording using PyAudio."""
-        self._cleanup_existing_file()
-
         logger.info("Starting cross-platform audio recording...")
 
         try:
-            # Initialize PyAudio
-            self.audio_instance = pyaudio.PyAudio()
+            # Imported on first use to keep PortAudio off the import path
+            import pyaudio
+
+            # Reuse the process-wide PyAudio instance
+            self.audio_instance = self._get_pa_instance(pyaudio)
+
+            # Reset buffer and reserve the WAV header before PortAudio starts
+            # delivering frames, so samples are appended as they arrive
+            self.audio_buffer = io.BytesIO()
+            self.audio_buffer.write(self._wav_header(0))
+            self._write_frames = self.audio_buffer.write
+            self._callback_result = (None, pyaudio.paContinue)
+            self._priority_raised = False
+            self.is_recording = True
 
-            # Configure audio stream
+            # Configure audio stream in callback mode so PortAudio's own
+            # capture thread hands buffers straight to us
             self.stream = self.audio_instance.open(
                 format=pyaudio.paInt16,  # 16-bit audio
                 channels=CHANNELS,
                 rate=SAMPLE_RATE,
                 input=True,
                 frames_per_buffer=self.chunk_size,
+                stream_callback=self._on_audio,
             )
 
             logger.info("Audio stream opened successfully")
 
-            # Reset buffer and start recording
-            self.audio_buffer.seek(0)
-            self.audio_buffer.truncate(0)
-            self.is_recording = True
-
-            self.recording_thread = threading.Thread(
-                target=self._record_to_memory, daemon=True
-            )
-            self.recording_thread.start()
-
         except OSError as e:
+            self.is_recording = False
             self._cleanup_audio_resources()
             raise RecordingError(f"Failed to initialize audio recording: {e}")
         except Exception as e:
+            self.is_recording = False
             self._cleanup_audio_resources()
             raise RecordingError(f"Unexpected error starting recording: {e}")
 
-    def _record_to_memory(self) -> None:
-        """Record audio data to memory buffer in separate thread."""
-        bytes_recorded = 0
+    @classmethod
+    def _get_pa_instance(cls, pyaudio_module) -> "pyaudio.PyAudio":
+        """Return the shared PyAudio instance, initializing PortAudio on first use."""
+        if cls._pa_instance is None:
+            cls._pa_instance = pyaudio_module.PyAudio()
+            atexit.register(cls._terminate_pa_instance)
+        return cls._pa_instance
+
+    @classmethod
+    def _terminate_pa_instance(cls) -> None:
+        """Shut down PortAudio at interpreter exit."""
+        if cls._pa_instance is not None:
+            try:
+                cls._pa_instance.terminate()
+            except Exception as e:
+                logger.error(f"Error terminating PyAudio: {e}")
+            cls._pa_instance = None
+
+    @staticmethod
+    def _wav_header(data_size: int) -> bytes:
+        """Build the WAV header for data_size bytes of PCM audio."""
+        block_align = CHANNELS * _SAMPLE_WIDTH
+        return _WAV_HEADER.pack(
+            b"RIFF",
+            _WAV_HEADER.size - 8 + data_size,
+            b"WAVE",
+            b"fmt ",
+            16,  # fmt chunk size
+            1,  # PCM
+            CHANNELS,
+            SAMPLE_RATE,
+            SAMPLE_RATE * block_align,
+            block_align,
+            _SAMPLE_WIDTH * 8,
+            b"data",
+            data_size,
+        )
+
+    def _on_audio(self, in_data, frame_count, time_info, status_flags):
+        """Append captured audio to the WAV buffer (runs on PortAudio's thread)."""
+        if not self._priority_raised:
+            self._raise_capture_thread_priority()
+
+        if in_data:
+            with self._buffer_lock:
+                # Raw append; the header sizes are patched once at the end
+                self._write_frames(in_data)
+                listener = self.audio_listener
+                if listener:
+                    listener(in_data)
+        return self._callback_result
+
+    def _raise_capture_thread_priority(self) -> None:
+        """Best-effort scheduling boost for the calling (capture) thread.
+
+        Keeps capture ahead of CPU contention so buffers are not overrun.
+        Real-time scheduling usually needs CAP_SYS_NICE or an rtprio limit,
+        so failures are expected and only logged.
+        """
+        self._priority_raised = True
+
+        try:
+            os.sched_setscheduler(
+                0, os.SCHED_FIFO, os.sched_param(CAPTURE_THREAD_RT_PRIORITY)
+            )
+            logger.debug("Capture thread switched to SCHED_FIFO")
+            return
+        except (AttributeError, OSError) as e:
+            logger.debug(f"Real-time scheduling unavailable for capture thread: {e}")
 
         try:
-            while self.is_recording and self.stream:
-                try:
-                    # Read audio data from stream
-                    data = self.stream.read(
-                        self.chunk_size, exception_on_overflow=False
-                    )
-                    if data:
-                        self.audio_buffer.write(data)
-                        bytes_recorded += len(data)
-
-                except OSError as e:
-                    logger.error(f"Error reading audio data: {e}")
-                    break
-                except Exception as e:
-                    logger.error(f"Unexpected error during recording: {e}")
-                    break
-
-        finally:
-            logger.info(
-                f"Recording thread finished, total bytes recorded: {bytes_recorded}"
+            os.setpriority(
+                os.PRIO_PROCESS, threading.get_native_id(), CAPTURE_THREAD_NICE
             )
+            logger.debug(f"Capture thread niceness set to {CAPTURE_THREAD_NICE}")
+        except (AttributeError, OSError) as e:
+            logger.debug(f"Could not raise capture thread priority: {e}")
+
+    def attach_audio_listener(self, listener: Callable[[bytes], None]) -> bool:
+        """Forward captured PCM audio to a listener during recording.
+
+        The listener first receives everything recorded so far, then each new
+        buffer as it is captured. It runs on PortAudio's thread and must not block.
+
+        Args:
+            listener: Callable receiving raw 16-bit PCM audio
+
+        Returns:
+            True if attached, False if no recording is in progress
+        """
+        with self._buffer_lock:
+            if not self.is_recording:
+                return False
+
+            if self.audio_buffer.tell() > _WAV_HEADER.size:
+                with self.audio_buffer.getbuffer() as buffer:
+                    listener(bytes(buffer[_WAV_HEADER.size :]))
+
+            self.audio_listener = listener
+
+        return True
 
     def stop_recording(self) -> bytes:
-        """Stop audio recording and return recorded data."""
+        """Stop audio recording and return the in-memory WAV data."""
         if not self.is_recording:
             logger.warning("No active recording to stop")
             return b""
 
         logger.info("Stopping audio recording...")
 
-        # Stop the recording loop
-        self.is_recording = False
+        # Taking the lock waits out a listener replay that may still hold a
+        # view of the buffer, and keeps new listeners from attaching
+        with self._buffer_lock:
+            self.is_recording = False
 
-        # Wait for recording thread to finish
-        if self.recording_thread:
-            self.recording_thread.join(timeout=5.0)
-            if self.recording_thread.is_alive():
-                logger.warning("Recording thread did not finish within timeout")
-
-        # Stop and close audio stream
+        # Stop and close audio stream outside the lock, since the capture
+        # callback takes it; stop_stream() returns only once the last
+        # callback has run, so the buffer is complete afterwards
         self._cleanup_audio_resources()
 
-        # Get the recorded data
-        audio_data = self.audio_buffer.getvalue()
-        logger.info(f"Retrieved {len(audio_data)} bytes of audio data from memory")
+        # Finalize the WAV header now that the data size is known
+        with self._buffer_lock:
+            self.audio_listener = None
+            frames_recorded = self._finalize_wav_header()
+        if not frames_recorded:
+            logger.info("No audio frames were recorded")
+            return b""
 
-        # Create WAV file from recorded data
-        if audio_data:
-            self._create_wav_file(audio_data)
+        # With no views exported, getvalue() hands back the buffer's own
+        # bytes object instead of copying it
+        audio_data = self.audio_buffer.getvalue()
+        logger.info(
+            f"Retrieved {len(audio_data)} bytes of WAV data "
+            f"({frames_recorded} frames) from memory"
+        )
 
         return audio_data
 
-    def _create_wav_file(self, raw_audio_data: bytes) -> None:
-        """Create WAV file from raw audio data."""
+    def _finalize_wav_header(self) -> int:
+        """Write the final data size into the WAV header and return the frame count."""
+        self._write_frames = None
+
+        data_size = self.audio_buffer.tell() - _WAV_HEADER.size
+        if data_size <= 0:
+            return 0
+
         try:
-            with wave.open(str(self.audio_file_path), "wb") as wav_file:
-                wav_file.setnchannels(CHANNELS)
-                wav_file.setsampwidth(2)  # 16-bit = 2 bytes
-                wav_file.setframerate(SAMPLE_RATE)
-                wav_file.writeframes(raw_audio_data)
+            self.audio_buffer.seek(0)
+            self.audio_buffer.write(self._wav_header(data_size))
+            self.audio_buffer.seek(0, io.SEEK_END)
+        except Exception as e:
+            logger.error(f"Error finalizing WAV data: {e}")
+            raise RecordingError(f"Failed to finalize WAV data: {e}")
+
+        return data_size // (CHANNELS * _SAMPLE_WIDTH)
+
+    def save_wav_file(self, wav_data: bytes) -> None:
+        """Write finalized WAV data to the audio file, if one is configured."""
+        if not self.audio_file_path or not wav_data:
+            return
+
+        try:
+            self.audio_file_path.write_bytes(wav_data)
 
             logger.info(f"Created WAV file: {self.audio_file_path}")
 
@@ -139,7 +263,7 @@ class AudioRecorder:
             raise RecordingError(f"Failed to create WAV file: {e}")
 
     def _cleanup_audio_resources(self) -> None:
-        """Clean up PyAudio resources."""
+        """Clean up the audio stream; the shared PyAudio instance stays alive."""
         try:
             if self.stream:
                 if self.stream.is_active():
@@ -147,35 +271,29 @@ class AudioRecorder:
                 self.stream.close()
                 self.stream = None
 
-            if self.audio_instance:
-                self.audio_instance.terminate()
-                self.audio_instance = None
+            self.audio_instance = None
 
         except Exception as e:
             logger.error(f"Error cleaning up audio resources: {e}")
 
-    def _cleanup_existing_file(self) -> None:
-        """Remove existing audio file if it exists."""
-        try:
-            if self.audio_file_path.exists():
-                self.audio_file_path.unlink()
-        except OSError as e:
-            logger.warning(f"Error removing existing audio file: {e}")
-
     def get_file_info(self) -> tuple[bool, int]:
         """Get audio file existence and size."""
-        if not self.audio_file_path.exists():
+        if not self.audio_file_path:
             return False, 0
 
         try:
-            size = self.audio_file_path.stat().st_size
-            return True, size
+            return True, self.audio_file_path.stat().st_size
         except OSError:
             return False, 0
 
+    def is_capturing(self) -> bool:
+        """Check whether the audio stream is still delivering frames."""
+        stream = self.stream
+        return self.is_recording and stream is not None and stream.is_active()
+
     def get_memory_buffer_size(self) -> int:
-        """Get current size of audio data in memory buffer."""
-        return len(self.audio_buffer.getvalue())
+        """Get current size of audio data in memory buffer, excluding the header."""
+        return max(0, self.audio_buffer.tell() - _WAV_HEADER.size)
 
     def __del__(self):
         """Ensure audio resources are cleaned up when object is destroyed."""
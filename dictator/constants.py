@@ -5,15 +5,36 @@ from pathlib import Path
 # File paths
 LOCKFILE_PATH = Path("/tmp/dictator.pid")
 AUDIO_FILE_PATH = Path("/tmp/dictator_recording.wav")
+LLM_CACHE_PATH = Path("/tmp/dictator_llm_cache.sqlite")
 
 # Audio settings
 SAMPLE_RATE = 16000
 CHANNELS = 1
+AUDIO_BUFFER_MS = 20  # PortAudio buffer length; bounds audio lost at stop
+CAPTURE_THREAD_RT_PRIORITY = 10  # SCHED_FIFO priority for the capture thread
+CAPTURE_THREAD_NICE = -10  # Fallback niceness when real-time is not permitted
+CAPTURE_CHECK_INTERVAL = 1  # Seconds between checks that capture is still alive
+STREAMING_SEND_MS = 200  # Audio batched into each live transcription send
+
+# Typing
+TYPING_CHAR_DELAY = 0.0  # Seconds between keystrokes; raise if an app drops keys
 
 # Timeouts
 PROCESS_TERMINATE_TIMEOUT = 5
 XDOTOOL_TIMEOUT = 2
+STREAMING_FINALIZE_TIMEOUT = 3  # Wait for the final live transcript after stop
 
 # LLM Post-processing
 DEFAULT_LLM_MODEL = "gemini/gemini-2.0-flash"
 LLM_PROCESSING_TIMEOUT = 30
+LLM_READ_TIMEOUT = 9  # Max wait for the first token or between streamed tokens
+LLM_MAX_RETRIES = 1  # Retries for timed-out or failed requests
+LLM_RETRY_BACKOFF = 0.5  # Seconds to wait before retrying a rejected request
+LLM_RETRY_MAX_DELAY = 5  # Cap on a server-requested Retry-After wait
+LLM_TEMPERATURE = 0.3  # Low temperature for consistent output
+LLM_MAX_TOKENS = 1000  # Reasonable limit for transcript processing
+GEMINI_MODEL_PREFIX = "gemini/"
+GEMINI_API_BASE_URL = "https://generativelanguage.googleapis.com"
+LLM_CONNECTION_WARMUP_TIMEOUT = 5
+LLM_CACHE_TTL = 24 * 60 * 60  # Seconds a cached LLM response stays valid
+LLM_CACHE_MAX_TRANSCRIPT_LENGTH = 2048  # Longer transcripts rarely repeat
@@ -0,0 +1,176 @@
+"""Minimal Gemini REST client for the LLM post-processing hot path."""
+
+import json
+import logging
+import time
+from typing import Any, Iterator
+
+import httpx
+
+from .constants import (
+    GEMINI_API_BASE_URL,
+    LLM_CONNECTION_WARMUP_TIMEOUT,
+    LLM_MAX_RETRIES,
+    LLM_PROCESSING_TIMEOUT,
+    LLM_READ_TIMEOUT,
+    LLM_RETRY_BACKOFF,
+    LLM_RETRY_MAX_DELAY,
+)
+from .exceptions import LLMProcessingError
+
+logger = logging.getLogger(__name__)
+
+
+class GeminiClient:
+    """Calls the Gemini generateContent API directly over a pooled connection."""
+
+    def __init__(
+        self,
+        model: str,
+        api_key: str,
+        temperature: float,
+        max_output_tokens: int,
+    ):
+        """Initialize the client.
+
+        Args:
+            model: Gemini model name without provider prefix, e.g. "gemini-2.0-flash"
+            api_key: Google AI Studio API key
+            temperature: Sampling temperature
+            max_output_tokens: Maximum number of tokens to generate
+        """
+        self._model_url = f"{GEMINI_API_BASE_URL}/v1beta/models/{model}"
+        self._generation_config = {
+            "temperature": temperature,
+            "maxOutputTokens": max_output_tokens,
+        }
+        self._client = httpx.Client(
+            headers={"x-goog-api-key": api_key},
+            # httpx timeouts apply per operation, not per request: a short
+            # read timeout bounds the wait for the first token and any stall
+            # mid-stream, so a slow request is retried; stream_generate
+            # enforces the overall deadline itself
+            timeout=httpx.Timeout(LLM_PROCESSING_TIMEOUT, read=LLM_READ_TIMEOUT),
+        )
+
+    def warm_up(self) -> None:
+        """Open the TCP/TLS connection ahead of the first request.
+
+        Failures are harmless; the first request simply connects itself.
+        """
+        try:
+            self._client.head(
+                GEMINI_API_BASE_URL, timeout=LLM_CONNECTION_WARMUP_TIMEOUT
+            )
+            logger.info("Gemini API connection warmed up")
+        except httpx.HTTPError as e:
+            logger.debug(f"Gemini API connection warm-up failed: {e}")
+
+    def generate(self, prompt: str) -> str:
+        """Generate a complete response for the prompt.
+
+        Raises:
+            LLMProcessingError: If the request fails
+        """
+        for attempt in range(LLM_MAX_RETRIES + 1):
+            try:
+                response = self._client.post(
+                    f"{self._model_url}:generateContent", json=self._build_body(prompt)
+                )
+                response.raise_for_status()
+                return self._extract_text(response.json())
+            except (httpx.HTTPError, ValueError) as e:
+                if self._should_retry(e, attempt):
+                    logger.warning(f"Gemini request failed, retrying: {e}")
+                    self._wait_before_retry(e)
+                    continue
+                raise LLMProcessingError(f"Gemini request failed: {e}")
+
+    def stream_generate(self, prompt: str) -> Iterator[str]:
+        """Yield response text as it is generated.
+
+        A failed request is retried only if no text has been yielded yet, since
+        earlier output may already have been typed.
+
+        Raises:
+            LLMProcessingError: If the request fails or exceeds the deadline
+        """
+        deadline = time.monotonic() + LLM_PROCESSING_TIMEOUT
+        for attempt in range(LLM_MAX_RETRIES + 1):
+            yielded = False
+            try:
+                with self._client.stream(
+                    "POST",
+                    f"{self._model_url}:streamGenerateContent",
+                    params={"alt": "sse"},
+                    json=self._build_body(prompt),
+                ) as response:
+                    response.raise_for_status()
+                    for line in response.iter_lines():
+                        # Each read is bounded, but a steady trickle of
+                        # chunks could otherwise run on indefinitely
+                        if time.monotonic() > deadline:
+                            raise LLMProcessingError(
+                                "Gemini streaming request exceeded "
+                                f"{LLM_PROCESSING_TIMEOUT}s deadline"
+                            )
+                        if not line.startswith("data:"):
+                            continue
+                        text = self._extract_text(json.loads(line[5:]))
+                        if text:
+                            yielded = True
+                            yield text
+                return
+            except (httpx.HTTPError, ValueError) as e:
+                if not yielded and self._should_retry(e, attempt):
+                    logger.warning(f"Gemini streaming request failed, retrying: {e}")
+                    self._wait_before_retry(e)
+                    continue
+                raise LLMProcessingError(f"Gemini streaming request failed: {e}")
+
+    def _should_retry(self, error: Exception, attempt: int) -> bool:
+        """Check whether a failed attempt is worth repeating."""
+        if attempt >= LLM_MAX_RETRIES:
+            return False
+        if isinstance(error, httpx.TransportError):
+            # Includes timeouts; a fresh attempt usually gets a faster path
+            return True
+        if isinstance(error, httpx.HTTPStatusError):
+            status_code = error.response.status_code
+            return status_code == 429 or status_code >= 500
+        return False
+
+    def _wait_before_retry(self, error: Exception) -> None:
+        """Back off before retrying a request the server rejected.
+
+        Transport errors, including timeouts, already took their time and
+        are retried immediately.
+        """
+        if not isinstance(error, httpx.HTTPStatusError):
+            return
+
+        delay = LLM_RETRY_BACKOFF
+        retry_after = error.response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                delay = min(max(0.0, float(retry_after)), LLM_RETRY_MAX_DELAY)
+            except ValueError:
+                # HTTP-date form; the default backoff is close enough
+                pass
+        time.sleep(delay)
+
+    def _build_body(self, prompt: str) -> dict[str, Any]:
+        """Build the generateContent request body."""
+        return {
+            "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+            "generationConfig": self._generation_config,
+        }
+
+    def _extract_text(self, payload: dict[str, Any]) -> str:
+        """Concatenate the text parts of the first candidate."""
+        candidates = payload.get("candidates") or []
+        if not candidates:
+            return ""
+
+        parts = candidates[0].get("content", {}).get("parts") or []
+        return "".join(part.get("text", "") for part in parts)
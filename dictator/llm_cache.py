@@ -0,0 +1,101 @@
+"""Persistent cache for LLM post-processing responses."""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+from .constants import LLM_CACHE_TTL
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """Caches LLM responses on disk so repeated dictations skip the API call."""
+
+    def __init__(self, db_path: Path, ttl: int = LLM_CACHE_TTL):
+        """Open the cache database, creating it if needed.
+
+        Args:
+            db_path: Path to the SQLite database file
+            ttl: Seconds before a cached response expires
+        """
+        self.db_path = db_path
+        self.ttl = ttl
+        self._connection: Optional[sqlite3.Connection] = None
+
+        try:
+            # Responses hold dictated text, so keep the database private;
+            # SQLite gives its WAL side files the same permissions
+            self._create_private_file(db_path)
+
+            # Opened during pre-warm and used from the main thread afterwards
+            connection = sqlite3.connect(
+                db_path, check_same_thread=False, isolation_level=None
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._connection = connection
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"LLM response cache unavailable: {e}")
+
+    @staticmethod
+    def _create_private_file(path: Path) -> None:
+        """Create path readable only by the current user, tightening an existing file."""
+        # Neither O_NOFOLLOW nor fchmod exists on Windows, where the mode
+        # bits do not govern access anyway
+        flags = os.O_RDWR | os.O_CREAT | getattr(os, "O_NOFOLLOW", 0)
+        fd = os.open(path, flags, 0o600)
+        try:
+            if hasattr(os, "fchmod"):
+                os.fchmod(fd, 0o600)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def make_key(model: str, prompt: str) -> str:
+        """Build the cache key for a model and fully formatted prompt."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(model.encode())
+        digest.update(b"\0")
+        digest.update(prompt.encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None if missing or expired."""
+        if not self._connection:
+            return None
+
+        try:
+            row = self._connection.execute(
+                "SELECT response FROM responses WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Error reading LLM response cache: {e}")
+            return None
+
+        return row[0] if row else None
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response and drop expired entries."""
+        if not self._connection:
+            return
+
+        now = time.time()
+        try:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (key, response, now + self.ttl),
+            )
+            self._connection.execute(
+                "DELETE FROM responses WHERE expires_at <= ?", (now,)
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Error writing LLM response cache: {e}")
@@ -2,13 +2,23 @@
 
 import logging
 import os
-import textwrap
-from typing import Optional
-
-import litellm
-
-from .constants import DEFAULT_LLM_MODEL, LLM_PROCESSING_TIMEOUT
+import queue
+import threading
+from typing import Iterator, Optional
+
+from .constants import (
+    DEFAULT_LLM_MODEL,
+    GEMINI_MODEL_PREFIX,
+    LLM_CACHE_MAX_TRANSCRIPT_LENGTH,
+    LLM_CACHE_PATH,
+    LLM_MAX_RETRIES,
+    LLM_MAX_TOKENS,
+    LLM_PROCESSING_TIMEOUT,
+    LLM_TEMPERATURE,
+)
 from .exceptions import LLMProcessingError
+from .gemini_client import GeminiClient
+from .llm_cache import LLMResponseCache
 from .prompt_manager import PromptManager
 from .text_typer import TextTyper
 from .window_detector import WindowDetector
@@ -19,36 +29,79 @@ logger = logging.getLogger(__name__)
 class LLMPostProcessor:
     """Post-processes transcribed text using LLM based on application context."""
 
-    def __init__(self, model: str = DEFAULT_LLM_MODEL):
+    def __init__(self, model: str = DEFAULT_LLM_MODEL, cache_enabled: bool = True):
         """Initialize the LLM post-processor.
 
         Args:
-            model: The LiteLLM model identifier to use for processing
+            model: The LiteLLM model identifier to use for processing; "gemini/"
+                models are called directly through the Gemini REST API
+            cache_enabled: Whether to reuse stored responses for repeated prompts
         """
         self.model = model
+        self._uses_gemini = model.startswith(GEMINI_MODEL_PREFIX)
+        # Read once; the environment is not expected to change mid-run
+        self._api_key = os.getenv("GEMINI_API_KEY")
+        # Bail out before paying for any imports when processing is disabled;
+        # other providers' keys are read by litellm itself
+        if self._uses_gemini:
+            self._validate_api_key()
+
+        self._gemini_client: Optional[GeminiClient] = None
+        self._litellm = None
+        if self._uses_gemini:
+            # Gemini is called directly, skipping litellm's per-request
+            # routing, response validation and callback machinery
+            self._gemini_client = GeminiClient(
+                model.removeprefix(GEMINI_MODEL_PREFIX),
+                self._api_key,
+                temperature=LLM_TEMPERATURE,
+                max_output_tokens=LLM_MAX_TOKENS,
+            )
+        else:
+            # litellm is slow to import; load it here, off the critical path
+            # during pre-warm, rather than at module import or on first completion
+            import litellm
+
+            self._litellm = litellm
+
         self.window_detector = WindowDetector()
         self.prompt_manager = PromptManager()
-        self._validate_api_key()
+        self.cache = LLMResponseCache(LLM_CACHE_PATH) if cache_enabled else None
+
+    def warm_up_connection(self) -> None:
+        """Open the connection to the LLM API ahead of the first request."""
+        if self._gemini_client:
+            self._gemini_client.warm_up()
 
     def _validate_api_key(self) -> None:
         """Validate that required API key is available."""
-        if not os.getenv("GEMINI_API_KEY"):
+        if not self._api_key:
             raise LLMProcessingError(
                 "GEMINI_API_KEY environment variable is required for LLM post-processing"
             )
 
-    def process_transcript(self, transcript: str) -> str:
+    def process_transcript(
+        self, transcript: str, window_info: Optional[dict[str, str]] = None
+    ) -> str:
         """Process transcript based on the currently focused application.
 
         Args:
             transcript: The original transcribed text
+            window_info: Focused window info from get_window_info(), detected
+                now if not given
 
         Returns:
             Processed text, or original transcript if processing fails/not needed
         """
         try:
+            if self._is_too_short_for_llm(transcript):
+                return transcript
+
+            if window_info is None:
+                window_info = self.get_window_info()
+
             # Get the context-specific prompt
-            prompt = self._get_context_prompt()
+            prompt = self._get_context_prompt(window_info)
 
             if not prompt:
                 return transcript
@@ -56,7 +109,9 @@ class LLMPostProcessor:
             logger.info(
                 f"Processing transcript with LLM (length: {len(transcript)} chars)"
             )
-            processed_text = self._call_llm(transcript, prompt)
+            processed_text = self._call_llm(
+                transcript, prompt, window_info.get("name", "")
+            )
 
             if processed_text:
                 logger.info(
@@ -71,30 +126,49 @@ class LLMPostProcessor:
             logger.error(f"LLM processing failed: {e}, using original transcript")
             return transcript
 
-    def process_transcript_streaming(self, transcript: str, text_typer):
+    def process_transcript_streaming(
+        self,
+        transcript: str,
+        text_typer,
+        window_info: Optional[dict[str, str]] = None,
+    ):
         """Process transcript with streaming output and real-time typing.
 
         Args:
             transcript: The original transcribed text
             text_typer: TextTyper instance for typing text chunks
+            window_info: Focused window info from get_window_info(), detected
+                now if not given
         """
         try:
+            if self._is_too_short_for_llm(transcript):
+                text_typer.type_text_chunk(transcript)
+                return
+
+            if window_info is None:
+                window_info = self.get_window_info()
+
             # Get the context-specific prompt
-            prompt = self._get_context_prompt()
+            prompt = self._get_context_prompt(window_info)
 
             if not prompt:
                 text_typer.type_text_chunk(transcript)
                 return
 
             # Check if we should add indicator for this app
-            window_info = self.window_detector.get_focused_window_info()
             app_class = window_info.get("class", "")
             add_indicator = self.prompt_manager.should_add_indicator_for_app(app_class)
 
             logger.info(
                 f"Processing transcript with streaming LLM (length: {len(transcript)} chars)"
             )
-            self._call_llm_streaming(transcript, prompt, text_typer, add_indicator)
+            self._call_llm_streaming(
+                transcript,
+                prompt,
+                text_typer,
+                window_info.get("name", ""),
+                add_indicator,
+            )
 
         except Exception as e:
             logger.error(
@@ -102,14 +176,40 @@ class LLMPostProcessor:
             )
             text_typer.type_text_chunk(transcript)
 
-    def _get_context_prompt(self) -> Optional[str]:
+    def _is_too_short_for_llm(self, transcript: str) -> bool:
+        """Check whether a transcript is too short to be worth an LLM round trip."""
+        min_words = self.prompt_manager.get_min_words_for_llm()
+        if min_words and len(transcript.split()) < min_words:
+            logger.info(
+                f"Transcript shorter than {min_words} words, skipping LLM processing"
+            )
+            return True
+        return False
+
+    def get_window_info(self) -> dict[str, str]:
+        """Detect the focused window whose context selects the prompt.
+
+        Safe to call from a worker thread while transcription finishes.
+
+        Returns:
+            Window information, or an empty dict if detection failed
+        """
+        try:
+            return self.window_detector.get_focused_window_info()
+        except Exception as e:
+            logger.warning(f"Failed to determine context: {e}")
+            return {}
+
+    def _get_context_prompt(self, window_info: dict[str, str]) -> Optional[str]:
         """Get the appropriate prompt based on the current application context.
 
+        Args:
+            window_info: Focused window info from get_window_info()
+
         Returns:
             Prompt string if context-specific processing is needed, None otherwise
         """
         try:
-            window_info = self.window_detector.get_focused_window_info()
             app_class = window_info.get("class", "")
 
             return self.prompt_manager.get_prompt_for_app(app_class)
@@ -118,41 +218,37 @@ class LLMPostProcessor:
             logger.warning(f"Failed to determine context: {e}")
             return None
 
-    def _call_llm(self, transcript: str, prompt_template: str) -> Optional[str]:
+    def _call_llm(
+        self, transcript: str, prompt_template: str, window_title: str
+    ) -> Optional[str]:
         """Call the LLM API to process the transcript.
 
         Args:
             transcript: The original transcribed text
             prompt_template: The prompt template with {transcript} and optional {window_title} placeholders
+            window_title: Focused window title for context-aware prompts
 
         Returns:
             Processed text from the LLM, or None if call fails
         """
         try:
-            # Get window title for context-aware prompts
-            window_info = self.window_detector.get_focused_window_info()
-            window_title = window_info.get("name", "")
-
             # Format the prompt with transcript and window title
-            formatted_prompt = textwrap.dedent(
-                self.prompt_manager.format_prompt(
-                    prompt_template, transcript, window_title
-                )
-            ).strip()
-
-            # Call LiteLLM
-            response = litellm.completion(
-                model=self.model,
-                messages=[{"role": "user", "content": formatted_prompt}],
-                temperature=0.3,  # Low temperature for consistent output
-                max_tokens=1000,  # Reasonable limit for transcript processing
-                timeout=LLM_PROCESSING_TIMEOUT,
+            formatted_prompt = self.prompt_manager.format_prompt(
+                prompt_template, transcript, window_title
             )
 
-            if response and response.choices and len(response.choices) > 0:
-                processed_text = response.choices[0].message.content
-                if processed_text:
-                    return processed_text.strip()
+            cache_key = self._get_cache_key(transcript, formatted_prompt)
+            if cache_key:
+                cached_text = self.cache.get(cache_key)
+                if cached_text is not None:
+                    logger.info("Using cached LLM response")
+                    return cached_text
+
+            processed_text = (self._complete(formatted_prompt) or "").strip()
+            if processed_text:
+                if cache_key:
+                    self.cache.set(cache_key, processed_text)
+                return processed_text
 
             logger.warning("LLM response was empty or malformed")
             return None
@@ -166,6 +262,7 @@ class LLMPostProcessor:
         transcript: str,
         prompt_template: str,
         text_typer: TextTyper,
+        window_title: str,
         add_indicator: bool = False,
     ) -> None:
         """Call the LLM API with streaming to process the transcript.
@@ -174,43 +271,25 @@ class LLMPostProcessor:
             transcript: The original transcribed text
             prompt_template: The prompt template with {transcript} and optional {window_title} placeholders
             text_typer: TextTyper instance for typing text chunks
+            window_title: Focused window title for context-aware prompts
             add_indicator: Whether to add LLM indicator at the end
         """
         try:
-            # Get window title for context-aware prompts
-            window_info = self.window_detector.get_focused_window_info()
-            window_title = window_info.get("name", "")
-
             # Format the prompt with transcript and window title
-            formatted_prompt = textwrap.dedent(
-                self.prompt_manager.format_prompt(
-                    prompt_template, transcript, window_title
-                )
-            ).strip()
-
-            # Call LiteLLM with streaming
-            response = litellm.completion(
-                model=self.model,
-                messages=[{"role": "user", "content": formatted_prompt}],
-                temperature=0.3,  # Low temperature for consistent output
-                max_tokens=1000,  # Reasonable limit for transcript processing
-                timeout=LLM_PROCESSING_TIMEOUT,
-                stream=True,  # Enable streaming
+            formatted_prompt = self.prompt_manager.format_prompt(
+                prompt_template, transcript, window_title
             )
 
-            # Process streaming response
-            chunks_processed = False
-            for chunk in response:
-                try:
-                    if chunk.choices and len(chunk.choices) > 0:
-                        delta = chunk.choices[0].delta
-                        if hasattr(delta, "content") and delta.content:
-                            # Type each chunk as it arrives
-                            text_typer.type_text_chunk(delta.content)
-                            chunks_processed = True
-                except Exception as chunk_error:
-                    logger.warning(f"Error processing chunk: {chunk_error}")
-                    continue
+            cache_key = self._get_cache_key(transcript, formatted_prompt)
+            cached_text = self.cache.get(cache_key) if cache_key else None
+            if cached_text is not None:
+                logger.info("Using cached LLM response")
+                text_typer.type_text_chunk(cached_text)
+                chunks_processed = bool(cached_text)
+            else:
+                chunks_processed = self._stream_llm_response(
+                    formatted_prompt, text_typer, cache_key
+                )
 
             # Add indicator at the end if configured and we processed content
             if add_indicator and chunks_processed:
@@ -226,13 +305,122 @@ class LLMPostProcessor:
                 f"Failed to process transcript with streaming LLM: {e}"
             )
 
+    def _stream_llm_response(
+        self, formatted_prompt: str, text_typer: TextTyper, cache_key: Optional[str]
+    ) -> bool:
+        """Stream an LLM completion into the text typer.
+
+        Args:
+            formatted_prompt: The fully formatted prompt to send
+            text_typer: TextTyper instance for typing text chunks
+            cache_key: Key to store the complete response under, if cacheable
+
+        Returns:
+            True if any content was typed
+        """
+        # Typing runs on its own thread so keystrokes never hold up reading
+        # the next chunk from the network
+        typing_queue: queue.Queue[Optional[str]] = queue.Queue()
+        typer_thread = threading.Thread(
+            target=self._type_queued_chunks,
+            args=(typing_queue, text_typer),
+            daemon=True,
+        )
+        typer_thread.start()
+
+        response_parts = []
+        try:
+            for text in self._complete_streaming(formatted_prompt):
+                typing_queue.put(text)
+                response_parts.append(text)
+        finally:
+            typing_queue.put(None)
+            typer_thread.join()
+
+        # Stored stripped, the same as complete responses
+        response_text = "".join(response_parts).strip()
+        if cache_key and response_text:
+            self.cache.set(cache_key, response_text)
+
+        return bool(response_parts)
+
+    @staticmethod
+    def _type_queued_chunks(
+        typing_queue: "queue.Queue[Optional[str]]", text_typer: TextTyper
+    ) -> None:
+        """Type queued text until the end marker, merging chunks that pile up."""
+        finished = False
+        while not finished:
+            chunks = [typing_queue.get()]
+            while not typing_queue.empty():
+                chunks.append(typing_queue.get_nowait())
+
+            if None in chunks:
+                chunks = chunks[: chunks.index(None)]
+                finished = True
+
+            if chunks:
+                try:
+                    text_typer.type_text_chunk("".join(chunks))
+                except Exception as e:
+                    logger.error(f"Error typing streamed text: {e}")
+
+    def _complete(self, formatted_prompt: str) -> Optional[str]:
+        """Request a complete response from the configured model."""
+        if self._gemini_client:
+            return self._gemini_client.generate(formatted_prompt)
+
+        response = self._litellm.completion(
+            model=self.model,
+            messages=[{"role": "user", "content": formatted_prompt}],
+            temperature=LLM_TEMPERATURE,
+            max_tokens=LLM_MAX_TOKENS,
+            timeout=LLM_PROCESSING_TIMEOUT,
+            num_retries=LLM_MAX_RETRIES,
+        )
+
+        if response and response.choices and len(response.choices) > 0:
+            return response.choices[0].message.content
+        return None
+
+    def _complete_streaming(self, formatted_prompt: str) -> Iterator[str]:
+        """Yield response text from the configured model as it is generated."""
+        if self._gemini_client:
+            yield from self._gemini_client.stream_generate(formatted_prompt)
+            return
+
+        response = self._litellm.completion(
+            model=self.model,
+            messages=[{"role": "user", "content": formatted_prompt}],
+            temperature=LLM_TEMPERATURE,
+            max_tokens=LLM_MAX_TOKENS,
+            timeout=LLM_PROCESSING_TIMEOUT,
+            num_retries=LLM_MAX_RETRIES,
+            stream=True,  # Enable streaming
+        )
+
+        for chunk in response:
+            try:
+                content = None
+                if chunk.choices and len(chunk.choices) > 0:
+                    content = getattr(chunk.choices[0].delta, "content", None)
+            except Exception as chunk_error:
+                logger.warning(f"Error processing chunk: {chunk_error}")
+                continue
+
+            if content:
+                yield content
+
+    def _get_cache_key(self, transcript: str, formatted_prompt: str) -> Optional[str]:
+        """Return the response cache key, or None if this prompt should not be cached."""
+        if not self.cache or len(transcript) > LLM_CACHE_MAX_TRANSCRIPT_LENGTH:
+            return None
+        return self.cache.make_key(self.model, formatted_prompt)
+
     def is_enabled(self) -> bool:
         """Check if LLM post-processing is enabled and properly configured.
 
         Returns:
             True if post-processing can be used, False otherwise
         """
-        try:
-            return bool(os.getenv("GEMINI_API_KEY"))
-        except Exception:
-            return False
+        return bool(self._api_key) or not self._uses_gemini
@@ -1,12 +1,20 @@
 """Process management and lockfile operations."""
 
+import errno
 import logging
 import os
+import signal
 from pathlib import Path
 from typing import Optional
 
 from .exceptions import RecordingError
 
+try:
+    import fcntl
+except ImportError:
+    # Windows has no flock; the lockfile then only records the PID
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,51 +23,179 @@ class ProcessManager:
 
     def __init__(self, lockfile_path: Path):
         self.lockfile_path = lockfile_path
+        # Open descriptor carrying our lock on the lockfile, while we hold it
+        self._lock_fd: Optional[int] = None
+        self._owns_lockfile = False
 
     def is_running(self) -> bool:
         """Check if a process is currently running."""
-        if not self.lockfile_path.exists():
-            return False
+        return self.get_running_pid() is not None
+
+    def create_lockfile(self) -> None:
+        """Create lockfile with current PID and hold an exclusive lock on it.
+
+        The lock belongs to the open descriptor, so the kernel releases it
+        however this process exits; a file left behind by a killed process
+        never blocks the next recording.
+        """
+        if fcntl is None:
+            self._create_pid_lockfile()
+            return
+
+        pid = os.getpid()
+        while True:
+            try:
+                fd = os.open(self.lockfile_path, os.O_RDWR | os.O_CREAT, 0o644)
+            except OSError as e:
+                raise RecordingError(f"Failed to create lockfile: {e}")
+
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                raise RecordingError("Another recording process is already running")
+            except OSError as e:
+                os.close(fd)
+                raise RecordingError(f"Failed to lock lockfile: {e}")
+
+            # A finishing process unlinks the file while still holding its
+            # lock, so we may have locked an orphaned inode; start over
+            if self._holds_current_lockfile(fd):
+                break
+            os.close(fd)
 
         try:
-            pid = self._read_pid()
-            os.kill(pid, 0)  # Signal 0 checks if process exists
-            return True
-        except (ProcessLookupError, ValueError, OSError):
-            self._cleanup_lockfile()
-            return False
+            os.ftruncate(fd, 0)
+            os.write(fd, str(pid).encode())
+        except OSError as e:
+            os.close(fd)
+            raise RecordingError(f"Failed to create lockfile: {e}")
 
-    def create_lockfile(self) -> None:
-        """Create lockfile with current PID."""
+        self._lock_fd = fd
+        self._owns_lockfile = True
+        logger.info(f"Lockfile created with PID: {pid}")
+
+    def _create_pid_lockfile(self) -> None:
+        """Create lockfile with current PID, where flock is unavailable."""
         if self.is_running():
             raise RecordingError("Another recording process is already running")
 
         pid = os.getpid()
         try:
-            with open(self.lockfile_path, "w") as f:
-                f.write(str(pid))
-            logger.info(f"Lockfile created with PID: {pid}")
+            self.lockfile_path.write_bytes(str(pid).encode())
         except OSError as e:
             raise RecordingError(f"Failed to create lockfile: {e}")
 
-    def _read_pid(self) -> int:
-        """Read PID from lockfile."""
+        self._owns_lockfile = True
+        logger.info(f"Lockfile created with PID: {pid}")
+
+    def _holds_current_lockfile(self, fd: int) -> bool:
+        """Check whether fd still refers to the file at the lockfile path."""
         try:
-            with open(self.lockfile_path, "r") as f:
-                return int(f.read().strip())
+            path_stat = self.lockfile_path.stat()
+        except FileNotFoundError:
+            return False
+        fd_stat = os.fstat(fd)
+        return (fd_stat.st_dev, fd_stat.st_ino) == (path_stat.st_dev, path_stat.st_ino)
+
+    def _is_locked(self) -> bool:
+        """Check whether a live process holds the lock on the lockfile."""
+        try:
+            fd = os.open(self.lockfile_path, os.O_RDONLY)
+        except FileNotFoundError:
+            return False
+
+        try:
+            fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+            return False
+        except BlockingIOError:
+            return True
+        finally:
+            # Closing also drops the shared lock if we just took it
+            os.close(fd)
+
+    def _read_pid(self) -> Optional[int]:
+        """Read PID from lockfile, or None if there is no lockfile."""
+        try:
+            # int() accepts bytes and ignores surrounding whitespace
+            return int(self.lockfile_path.read_bytes())
+        except FileNotFoundError:
+            return None
         except (ValueError, OSError) as e:
             raise RecordingError(f"Invalid lockfile: {e}")
 
     def get_running_pid(self) -> Optional[int]:
         """Get PID of running process, if any."""
-        if not self.is_running():
+        try:
+            if fcntl is None:
+                pid = self._read_pid()
+                if pid is not None:
+                    os.kill(pid, 0)  # Signal 0 checks if process exists
+                return pid
+
+            # An unlocked lockfile is stale whatever PID it names
+            if not self._is_locked():
+                return None
+            return self._read_pid()
+        except (RecordingError, OSError):
+            return None
+
+    def signal_running_process(self, signum: int) -> Optional[int]:
+        """Send a signal to the running process, if any.
+
+        Returns:
+            PID of the signalled process, or None if no process was running
+
+        Raises:
+            OSError: If the process exists but cannot be signalled
+        """
+        pid = self.get_running_pid()
+        if pid is None:
+            return None
+
+        try:
+            self._send_signal(pid, signum)
+        except ProcessLookupError:
             return None
-        return self._read_pid()
+        return pid
+
+    @staticmethod
+    def _send_signal(pid: int, signum: int) -> None:
+        """Signal a process, through a pidfd where the platform supports it.
+
+        Opening the pidfd doubles as the liveness check, and the signal then
+        goes to exactly that process even if the PID is reused meanwhile.
+        """
+        pidfd_open = getattr(os, "pidfd_open", None)
+        if pidfd_open is None:
+            os.kill(pid, signum)
+            return
+
+        try:
+            pidfd = pidfd_open(pid)
+        except OSError as e:
+            if e.errno != errno.ENOSYS:
+                raise
+            # Kernel predates pidfd support
+            os.kill(pid, signum)
+            return
+
+        try:
+            signal.pidfd_send_signal(pidfd, signum)
+        finally:
+            os.close(pidfd)
 
     def _cleanup_lockfile(self) -> None:
-        """Remove lockfile if it exists."""
+        """Remove the lockfile and release its lock, if this process holds it."""
+        if not self._owns_lockfile:
+            return
+
         try:
-            if self.lockfile_path.exists():
-                self.lockfile_path.unlink()
+            self.lockfile_path.unlink(missing_ok=True)
         except OSError as e:
             logger.error(f"Error removing lockfile: {e}")
+
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+        self._owns_lockfile = False
@@ -1,15 +1,25 @@
 """Prompt management for LLM post-processing configuration."""
 
 import logging
+import textwrap
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
 from .exceptions import PromptConfigError
 
+# Prefer the libyaml-backed loader; the pure-Python one is several times slower
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
+# Validated configs by path, reused while the file's mtime and size match
+_CONFIG_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
 
 class PromptManager:
     """Manages LLM prompts and application mappings from configuration file."""
@@ -26,20 +36,40 @@ class PromptManager:
 
         self.config_path = config_path
         self.config: Dict[str, Any] = {}
+        # Flattened application lookup, rebuilt whenever the config is loaded
+        self._app_patterns: List[Tuple[str, Optional[str], bool]] = []
+        self._default_template: Optional[str] = None
+        self._default_add_indicator = False
+        self._app_match_cache: Dict[str, Tuple[Optional[str], bool]] = {}
         self._load_config()
 
     def _load_config(self) -> None:
         """Load the prompt configuration from YAML file."""
         try:
-            if not self.config_path.exists():
+            try:
+                stat = self.config_path.stat()
+            except FileNotFoundError:
                 logger.warning(f"Prompt config file not found: {self.config_path}")
                 self._load_default_config()
                 return
 
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                self.config = yaml.safe_load(f) or {}
+            cache_key = str(self.config_path)
+            cached = _CONFIG_CACHE.get(cache_key)
+            if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                self.config = cached[2]
+            else:
+                with open(self.config_path, "r", encoding="utf-8") as f:
+                    self.config = yaml.load(f, Loader=_YamlLoader) or {}
+
+                self._validate_config()
+                self._normalize_templates()
+                _CONFIG_CACHE[cache_key] = (
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    self.config,
+                )
 
-            self._validate_config()
+            self._build_app_lookup()
 
         except yaml.YAMLError as e:
             logger.error(f"Invalid YAML in prompt config: {e}")
@@ -52,6 +82,7 @@ class PromptManager:
         """Load a minimal default configuration when config file is missing."""
         logger.info("Using default prompt configuration")
         self.config = {"prompts": {}, "applications": {"default": {"prompt": None}}}
+        self._build_app_lookup()
 
     def _validate_config(self) -> None:
         """Validate the loaded configuration structure."""
@@ -85,55 +116,89 @@ class PromptManager:
                     f"Prompt '{prompt_name}' template must contain '{{transcript}}' placeholder"
                 )
 
-    def get_prompt_for_app(self, app_class: str) -> Optional[str]:
-        """Get the prompt template for a given application class.
+    def _normalize_templates(self) -> None:
+        """Dedent and strip templates once so formatting is a plain substitution."""
+        for prompt_config in self.config["prompts"].values():
+            prompt_config["template"] = textwrap.dedent(
+                prompt_config["template"]
+            ).strip()
 
-        Args:
-            app_class: The window class name from window detection
+    def _build_app_lookup(self) -> None:
+        """Flatten application mappings into a pattern table for fast matching.
 
-        Returns:
-            Prompt template string if found, None if no processing should be done
+        Each entry is (lowercased pattern, template, add_indicator). A template
+        of None means the matching app is deliberately left unprocessed.
         """
-        if not app_class:
-            return None
+        prompts = self.config.get("prompts", {})
+        app_patterns = []
 
-        app_class_lower = app_class.lower()
-
-        # Check each application group for pattern matches
         for app_group, config in self.config.get("applications", {}).items():
-            if app_group == "default":
-                continue
-
-            if not isinstance(config, dict):
+            if app_group == "default" or not isinstance(config, dict):
                 continue
 
             patterns = config.get("patterns", [])
             if not isinstance(patterns, list):
                 continue
 
-            # Check if any pattern matches the app class
+            prompt_name = config.get("prompt")
+            if prompt_name is None:
+                template, add_indicator = None, False
+            elif prompt_name in prompts:
+                template = prompts[prompt_name]["template"]
+                add_indicator = prompts[prompt_name].get("add_indicator", False)
+            else:
+                logger.warning(
+                    f"App group '{app_group}' references unknown prompt '{prompt_name}'"
+                )
+                continue
+
             for pattern in patterns:
-                if isinstance(pattern, str) and pattern.lower() in app_class_lower:
-                    prompt_name = config.get("prompt")
-                    if prompt_name and prompt_name in self.config.get("prompts", {}):
-                        template = self.config["prompts"][prompt_name]["template"]
-                        return template
-                    elif prompt_name is None:
-                        return None
-                    else:
-                        logger.warning(
-                            f"App '{app_class}' references unknown prompt '{prompt_name}'"
-                        )
-
-        # No specific match found, check default
+                if isinstance(pattern, str):
+                    app_patterns.append((pattern.lower(), template, add_indicator))
+
+        self._app_patterns = app_patterns
+        self._app_match_cache = {}
+
         default_config = self.config.get("applications", {}).get("default", {})
         default_prompt = default_config.get("prompt")
+        if default_prompt and default_prompt in prompts:
+            self._default_template = prompts[default_prompt]["template"]
+            self._default_add_indicator = prompts[default_prompt].get(
+                "add_indicator", False
+            )
+        else:
+            self._default_template = None
+            self._default_add_indicator = False
+
+    def _match_app(self, app_class: str) -> Tuple[Optional[str], bool]:
+        """Resolve (template, add_indicator) for an app class, memoized per class."""
+        match = self._app_match_cache.get(app_class)
+        if match is not None:
+            return match
+
+        app_class_lower = app_class.lower()
+        match = (self._default_template, self._default_add_indicator)
+        for pattern, template, add_indicator in self._app_patterns:
+            if pattern in app_class_lower:
+                match = (template, add_indicator)
+                break
 
-        if default_prompt and default_prompt in self.config.get("prompts", {}):
-            template = self.config["prompts"][default_prompt]["template"]
-            return template
+        self._app_match_cache[app_class] = match
+        return match
 
-        return None
+    def get_prompt_for_app(self, app_class: str) -> Optional[str]:
+        """Get the prompt template for a given application class.
+
+        Args:
+            app_class: The window class name from window detection
+
+        Returns:
+            Prompt template string if found, None if no processing should be done
+        """
+        if not app_class:
+            return None
+
+        return self._match_app(app_class)[0]
 
     def reload_config(self) -> None:
         """Reload the configuration from file.
@@ -179,37 +244,7 @@ class PromptManager:
         if not app_class:
             return False
 
-        app_class_lower = app_class.lower()
-
-        # Check each application group for pattern matches
-        for app_group, config in self.config.get("applications", {}).items():
-            if app_group == "default":
-                continue
-
-            if not isinstance(config, dict):
-                continue
-
-            patterns = config.get("patterns", [])
-            if not isinstance(patterns, list):
-                continue
-
-            # Check if any pattern matches the app class
-            for pattern in patterns:
-                if isinstance(pattern, str) and pattern.lower() in app_class_lower:
-                    prompt_name = config.get("prompt")
-                    if prompt_name and prompt_name in self.config.get("prompts", {}):
-                        prompt_config = self.config["prompts"][prompt_name]
-                        return prompt_config.get("add_indicator", False)
-
-        # Check default
-        default_config = self.config.get("applications", {}).get("default", {})
-        default_prompt = default_config.get("prompt")
-
-        if default_prompt and default_prompt in self.config.get("prompts", {}):
-            prompt_config = self.config["prompts"][default_prompt]
-            return prompt_config.get("add_indicator", False)
-
-        return False
+        return self._match_app(app_class)[1]
 
     def get_llm_indicator(self) -> str:
         """Get the configured LLM indicator character.
@@ -219,6 +254,14 @@ class PromptManager:
         """
         return self.config.get("config", {}).get("llm_indicator", "✦")
 
+    def get_min_words_for_llm(self) -> int:
+        """Get the minimum transcript word count worth sending to the LLM.
+
+        Returns:
+            Word count below which transcripts are typed as-is (0 disables the check)
+        """
+        return self.config.get("config", {}).get("min_words_for_llm", 0)
+
     def format_prompt(
         self, template: str, transcript: str, window_title: Optional[str] = None
     ) -> str:
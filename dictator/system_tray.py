@@ -2,10 +2,13 @@
 
 import logging
 import threading
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
-import pystray
-from PIL import Image, ImageDraw
+# pystray and PIL are imported where used; importing the package (which
+# re-exports this module) should not pay for them before the tray starts
+if TYPE_CHECKING:
+    import pystray
+    from PIL import Image, ImageDraw
 
 logger = logging.getLogger(__name__)
 
@@ -14,9 +17,19 @@ class SystemTrayManager:
     """Manages system tray icon and states."""
 
     def __init__(self):
-        self.icon: Optional[pystray.Icon] = None  # type: ignore
+        self.icon: Optional["pystray.Icon"] = None  # type: ignore
         self.tray_thread: Optional[threading.Thread] = None
         self._running = False
+        # Rendered icon per state; each is drawn at most once
+        self._icon_images: dict[str, "Image.Image"] = {}
+        self._menus: dict[str, "pystray.Menu"] = {}
+        # Menu status text and icon renderer for each state
+        self._states: dict[str, tuple[str, Callable[[], "Image.Image"]]] = {
+            "idle": ("Idle", self._create_idle_icon),
+            "recording": ("Recording...", self._create_recording_icon),
+            "transcribing": ("Transcribing...", self._create_transcribing_icon),
+            "processing": ("Processing & Typing...", self._create_processing_icon),
+        }
 
     def start(self) -> None:
         """Start the system tray icon."""
@@ -26,20 +39,14 @@ class SystemTrayManager:
 
         logger.info("Starting system tray")
 
-        # Create initial icon (idle state)
-        icon_image = self._create_idle_icon()
-
-        # Create tray icon with menu
-        menu = pystray.Menu(
-            pystray.MenuItem("Dictator", None, enabled=False),
-            pystray.Menu.SEPARATOR,
-            pystray.MenuItem("Status: Idle", None, enabled=False),
-            pystray.Menu.SEPARATOR,
-            pystray.MenuItem("Quit", self._quit_callback),
-        )
+        import pystray
 
+        # Create tray icon in the idle state
         self.icon = pystray.Icon(
-            "dictator", icon_image, "Dictator - Voice Transcription", menu
+            "dictator",
+            self._get_icon_image("idle"),
+            "Dictator - Voice Transcription",
+            self._get_menu("idle"),
         )
 
         # Run in separate thread
@@ -64,75 +71,27 @@ class SystemTrayManager:
 
     def set_recording_state(self) -> None:
         """Update tray icon to show recording state."""
-        if not self.icon:
-            return
-
-        icon_image = self._create_recording_icon()
-        self.icon.icon = icon_image
-
-        # Update menu
-        menu = pystray.Menu(
-            pystray.MenuItem("Dictator", None, enabled=False),
-            pystray.Menu.SEPARATOR,
-            pystray.MenuItem("Status: Recording...", None, enabled=False),
-            pystray.Menu.SEPARATOR,
-            pystray.MenuItem("Quit", self._quit_callback),
-        )
-        self.icon.menu = menu
+        self._set_state("recording")
 
     def set_transcribing_state(self) -> None:
         """Update tray icon to show transcribing state."""
-        if not self.icon:
-            return
-
-        icon_image = self._create_transcribing_icon()
-        self.icon.icon = icon_image
-
-        # Update menu
-        menu = pystray.Menu(
-            pystray.MenuItem("Dictator", None, enabled=False),
-            pystray.Menu.SEPARATOR,
-            pystray.MenuItem("Status: Transcribing...", None, enabled=False),
-            pystray.Menu.SEPARATOR,
-            pystray.MenuItem("Quit", self._quit_callback),
-        )
-        self.icon.menu = menu
+        self._set_state("transcribing")
 
     def set_processing_state(self) -> None:
         """Update tray icon to show LLM processing/typing state."""
-        if not self.icon:
-            return
-
-        icon_image = self._create_processing_icon()
-        self.icon.icon = icon_image
-
-        # Update menu
-        menu = pystray.Menu(
-            pystray.MenuItem("Dictator", None, enabled=False),
-            pystray.Menu.SEPARATOR,
-            pystray.MenuItem("Status: Processing & Typing...", None, enabled=False),
-            pystray.Menu.SEPARATOR,
-            pystray.MenuItem("Quit", self._quit_callback),
-        )
-        self.icon.menu = menu
+        self._set_state("processing")
 
     def set_idle_state(self) -> None:
         """Update tray icon to show idle state."""
+        self._set_state("idle")
+
+    def _set_state(self, state: str) -> None:
+        """Switch the tray icon and menu to the given state."""
         if not self.icon:
             return
 
-        icon_image = self._create_idle_icon()
-        self.icon.icon = icon_image
-
-        # Update menu
-        menu = pystray.Menu(
-            pystray.MenuItem("Dictator", None, enabled=False),
-            pystray.Menu.SEPARATOR,
-            pystray.MenuItem("Status: Idle", None, enabled=False),
-            pystray.Menu.SEPARATOR,
-            pystray.MenuItem("Quit", self._quit_callback),
-        )
-        self.icon.menu = menu
+        self.icon.icon = self._get_icon_image(state)
+        self.icon.menu = self._get_menu(state)
 
     def _run_tray(self) -> None:
         """Run the tray icon (should be called in separate thread)."""
@@ -141,16 +100,46 @@ class SystemTrayManager:
         except Exception as e:
             logger.error(f"Error running system tray: {e}")
 
-    def _quit_callback(self, icon: pystray.Icon, item) -> None:
+    def _quit_callback(self, icon: "pystray.Icon", item) -> None:
         """Handle quit menu item."""
         logger.info("Quit requested from system tray")
         self.stop()
 
-    def _create_idle_icon(self) -> Image.Image:
+    def _get_menu(self, state: str) -> "pystray.Menu":
+        """Return the tray menu for a state, building it only the first time."""
+        menu = self._menus.get(state)
+        if menu is None:
+            import pystray
+
+            status = self._states[state][0]
+            menu = self._menus[state] = pystray.Menu(
+                pystray.MenuItem("Dictator", None, enabled=False),
+                pystray.Menu.SEPARATOR,
+                pystray.MenuItem(f"Status: {status}", None, enabled=False),
+                pystray.Menu.SEPARATOR,
+                pystray.MenuItem("Quit", self._quit_callback),
+            )
+        return menu
+
+    def _get_icon_image(self, state: str) -> "Image.Image":
+        """Return the icon for a state, rendering it only the first time."""
+        icon_image = self._icon_images.get(state)
+        if icon_image is None:
+            icon_image = self._icon_images[state] = self._states[state][1]()
+        return icon_image
+
+    @staticmethod
+    def _new_canvas(size: int) -> tuple["Image.Image", "ImageDraw.ImageDraw"]:
+        """Create a transparent square image and a drawing context for it."""
+        from PIL import Image, ImageDraw
+
+        image = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+        return image, ImageDraw.Draw(image)
+
+    def _create_idle_icon(self) -> "Image.Image":
         """Create icon for idle state (gray circle)."""
         size = 64
-        image = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(image)
+        image, draw = self._new_canvas(size)
 
         # Draw gray circle
         margin = 8
@@ -163,11 +152,10 @@ class SystemTrayManager:
 
         return image
 
-    def _create_recording_icon(self) -> Image.Image:
+    def _create_recording_icon(self) -> "Image.Image":
         """Create icon for recording state (red circle)."""
         size = 64
-        image = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(image)
+        image, draw = self._new_canvas(size)
 
         # Draw red circle
         margin = 8
@@ -180,11 +168,10 @@ class SystemTrayManager:
 
         return image
 
-    def _create_transcribing_icon(self) -> Image.Image:
+    def _create_transcribing_icon(self) -> "Image.Image":
         """Create icon for transcribing state (blue circle with pulse effect)."""
         size = 64
-        image = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(image)
+        image, draw = self._new_canvas(size)
 
         # Draw blue circle
         margin = 8
@@ -204,11 +191,10 @@ class SystemTrayManager:
 
         return image
 
-    def _create_processing_icon(self) -> Image.Image:
+    def _create_processing_icon(self) -> "Image.Image":
         """Create icon for LLM processing/typing state (green circle)."""
         size = 64
-        image = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(image)
+        image, draw = self._new_canvas(size)
 
         # Draw green circle
         margin = 8
@@ -1,11 +1,14 @@
 """Text typing functionality using pynput."""
 
 import logging
-
+import os
 import time
+import unicodedata
 
 from pynput.keyboard import Controller, Key
 
+from .constants import TYPING_CHAR_DELAY
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,6 +19,24 @@ class TextTyper:
         """Initialize TextTyper with buffering for trailing newlines."""
         self._buffered_newlines = 0
         self._controller = Controller()
+        self._char_delay = self._read_char_delay()
+
+    @staticmethod
+    def _read_char_delay() -> float:
+        """Read the per-keystroke delay, overridable via DICTATOR_TYPING_DELAY.
+
+        Keystrokes are queued by the OS input pipeline, so no delay is needed
+        for most applications. A delay only helps targets that drop events.
+        """
+        value = os.getenv("DICTATOR_TYPING_DELAY")
+        if value is None:
+            return TYPING_CHAR_DELAY
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            logger.warning(f"Ignoring invalid DICTATOR_TYPING_DELAY: {value!r}")
+            return TYPING_CHAR_DELAY
 
     def type_text(self, text: str) -> None:
         """Type text using pynput with Unicode support."""
@@ -26,8 +47,16 @@ class TextTyper:
         preview = text[:50] + ("..." if len(text) > 50 else "")
         logger.info(f"Starting to type text: {preview}")
 
+        # Composed form sends accented letters as single characters rather
+        # than a base letter plus a combining mark pynput may fail to type
+        text = unicodedata.normalize("NFC", text)
+
+        if self._char_delay:
+            self._type_with_unicode_fallback(text)
+            return
+
         try:
-            self._controller.type(text)
+            self._type_skipping_invalid(text)
             logger.info("Text typed successfully")
 
         except Exception as e:
@@ -38,12 +67,30 @@ class TextTyper:
             )
             self._type_with_unicode_fallback(text)
 
+    def _type_skipping_invalid(self, text: str) -> None:
+        """Type text in as few controller calls as possible.
+
+        pynput types everything before a character it cannot map and then
+        reports that character's index, so typing resumes just past it.
+        """
+        while text:
+            try:
+                self._controller.type(text)
+                return
+            except Controller.InvalidCharacterException as e:
+                index, char = e.args
+                logger.warning(
+                    f"Skipping untypable character '{char}' (ord={ord(char)})"
+                )
+                text = text[index + 1 :]
+
     def _type_with_unicode_fallback(self, text: str) -> None:
-        """Type text character by character, skipping problematic Unicode characters."""
+        """Type text character by character, skipping untypable characters."""
         for char in text:
             try:
                 self._controller.type(char)
-                time.sleep(0.003)  # 3ms delay between characters
+                if self._char_delay:
+                    time.sleep(self._char_delay)
             except Exception as char_error:
                 logger.warning(
                     f"Skipping untypable character '{char}' (ord={ord(char)}): {char_error}"
@@ -66,29 +113,42 @@ class TextTyper:
         if not text_chunk:
             return
 
-        # First, output any buffered newlines from the previous chunk
-        for _ in range(self._buffered_newlines):
-            self._type_newline()
-        self._buffered_newlines = 0
+        text_chunk = unicodedata.normalize("NFC", text_chunk)
 
-        # Count trailing newlines in this chunk
-        trailing_newlines = len(text_chunk) - len(text_chunk.rstrip("\n"))
+        # Newlines from the previous chunk are typed first, merged with any
+        # that lead this chunk so each run goes out in one call
+        pending_newlines = self._buffered_newlines
+        self._buffered_newlines = 0
 
-        # Remove trailing newlines for processing
-        content_chunk = text_chunk.rstrip("\n")
+        # Separate trailing newlines; most streamed chunks have none
+        if text_chunk.endswith("\n"):
+            content_chunk = text_chunk.rstrip("\n")
+            trailing_newlines = len(text_chunk) - len(content_chunk)
+        else:
+            content_chunk = text_chunk
+            trailing_newlines = 0
 
         if content_chunk:
             # Split on newlines to handle each part separately
-            lines = content_chunk.split("\n")
+            if "\n" in content_chunk:
+                lines = content_chunk.split("\n")
+            else:
+                lines = [content_chunk]
 
+            last = len(lines) - 1
             for i, line in enumerate(lines):
                 # Type the text part (skip empty lines)
-                if line.strip():
-                    self._type_text_part(line.rstrip())
+                line = line.rstrip()
+                if line:
+                    self._type_newlines(pending_newlines)
+                    pending_newlines = 0
+                    self._type_text_part(line)
 
                 # Add newline if not the last line
-                if i < len(lines) - 1:
-                    self._type_newline()
+                if i < last:
+                    pending_newlines += 1
+
+        self._type_newlines(pending_newlines)
 
         # Buffer the trailing newlines instead of typing them immediately
         self._buffered_newlines = trailing_newlines
@@ -103,27 +163,26 @@ class TextTyper:
         if not text:
             return
 
+        if self._char_delay:
+            self._type_with_unicode_fallback(text)
+            return
+
         try:
-            self._controller.type(text)
-            time.sleep(0.001)  # 1ms delay for streaming
+            self._type_skipping_invalid(text)
 
         except Exception as e:
             logger.warning(f"pynput failed to type text part directly: {e}")
             # Fall back to character-by-character typing
-            for char in text:
-                try:
-                    self._controller.type(char)
-                    time.sleep(0.001)
-                except Exception as char_error:
-                    logger.warning(
-                        f"Skipping untypable character '{char}' (ord={ord(char)}): {char_error}"
-                    )
-
-    def _type_newline(self) -> None:
-        """Type a newline using Enter key."""
+            self._type_with_unicode_fallback(text)
+
+    def _type_newlines(self, count: int) -> None:
+        """Type a run of newlines using the Enter key."""
+        if not count:
+            return
+
         try:
-            self._controller.press(Key.enter)
-            self._controller.release(Key.enter)
+            for _ in range(count):
+                self._controller.tap(Key.enter)
 
         except Exception as e:
             logger.error(f"Error typing newline with pynput: {e}")
@@ -1,22 +1,39 @@
 """Transcription backends package."""
 
-from .base import TranscriptionBackend
-from .deepgram import DeepgramBackend
-from .assemblyai import AssemblyAIBackend
+from .base import StreamingTranscriptionSession, TranscriptionBackend
 
 
 def create_transcription_backend(backend: str = "deepgram") -> TranscriptionBackend:
     """Factory function to create appropriate transcription backend."""
+    # Each backend pulls in its vendor SDK, so only the selected one is imported
     if backend.lower() == "assemblyai":
+        from .assemblyai import AssemblyAIBackend
+
         return AssemblyAIBackend()
     elif backend.lower() == "deepgram":
+        from .deepgram import DeepgramBackend
+
         return DeepgramBackend()
     else:
         raise ValueError(f"Unknown transcription backend: {backend}")
 
 
+def __getattr__(name: str):
+    """Import backend classes on first access rather than with the package."""
+    if name == "DeepgramBackend":
+        from .deepgram import DeepgramBackend
+
+        return DeepgramBackend
+    if name == "AssemblyAIBackend":
+        from .assemblyai import AssemblyAIBackend
+
+        return AssemblyAIBackend
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "TranscriptionBackend",
+    "StreamingTranscriptionSession",
     "DeepgramBackend",
     "AssemblyAIBackend",
     "create_transcription_backend",
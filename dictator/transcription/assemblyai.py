@@ -1,8 +1,10 @@
 """Audio transcription service using AssemblyAI."""
 
+import io
 import logging
 import os
 from pathlib import Path
+from typing import BinaryIO, Union
 
 try:
     import assemblyai as aai
@@ -38,9 +40,21 @@ class AssemblyAIBackend(TranscriptionBackend):
         if file_size == 0:
             raise TranscriptionError("Audio file is empty")
 
+        return self._transcribe(str(audio_file_path))
+
+    def transcribe_audio(self, audio_data: bytes) -> str:
+        """Transcribe in-memory WAV data and return transcript."""
+        if not audio_data:
+            raise TranscriptionError("Audio data is empty")
+
+        logger.info(f"Starting AssemblyAI transcription of {len(audio_data)} bytes")
+        return self._transcribe(io.BytesIO(audio_data))
+
+    def _transcribe(self, audio_source: Union[str, BinaryIO]) -> str:
+        """Upload a file path or binary stream and return the transcript."""
         try:
             logger.info("Sending audio to AssemblyAI")
-            transcript = self.transcriber.transcribe(str(audio_file_path))
+            transcript = self.transcriber.transcribe(audio_source)
 
             if transcript.error:
                 raise TranscriptionError(
@@ -64,9 +78,6 @@ class AssemblyAIBackend(TranscriptionBackend):
     def _validate_audio_file(self, audio_file_path: Path) -> tuple[bool, int]:
         """Validate audio file exists and get size."""
         try:
-            if not audio_file_path.exists():
-                return False, 0
-            size = audio_file_path.stat().st_size
-            return True, size
+            return True, audio_file_path.stat().st_size
         except OSError:
             return False, 0
@@ -1,7 +1,49 @@
-"""Abstract base class for transcription backends."""
+"""Abstract base classes for transcription backends."""
 
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Optional
+
+
+class StreamingTranscriptionSession(ABC):
+    """Abstract base class for transcribing audio while it is being recorded."""
+
+    @abstractmethod
+    def start(self) -> None:
+        """Open the streaming connection.
+
+        Raises:
+            TranscriptionError: If the connection cannot be established
+        """
+        pass
+
+    @abstractmethod
+    def send_audio(self, audio_data: bytes) -> None:
+        """Queue raw 16-bit PCM audio for transcription.
+
+        Must not block, as it is called from the audio capture thread.
+
+        Args:
+            audio_data: Raw PCM audio matching SAMPLE_RATE and CHANNELS
+        """
+        pass
+
+    @abstractmethod
+    def finish(self) -> str:
+        """Flush remaining audio, close the connection and return the transcript.
+
+        Returns:
+            Transcribed text as a string
+
+        Raises:
+            TranscriptionError: If the final transcript cannot be obtained
+        """
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Close the connection without waiting for a transcript."""
+        pass
 
 
 class TranscriptionBackend(ABC):
@@ -21,3 +63,26 @@ class TranscriptionBackend(ABC):
             TranscriptionError: If transcription fails
         """
         pass
+
+    @abstractmethod
+    def transcribe_audio(self, audio_data: bytes) -> str:
+        """Transcribe in-memory WAV data and return transcript.
+
+        Args:
+            audio_data: Complete WAV file contents
+
+        Returns:
+            Transcribed text as a string
+
+        Raises:
+            TranscriptionError: If transcription fails
+        """
+        pass
+
+    def create_streaming_session(self) -> Optional[StreamingTranscriptionSession]:
+        """Create a session that transcribes audio during recording.
+
+        Returns:
+            A new streaming session, or None if the backend only supports files
+        """
+        return None
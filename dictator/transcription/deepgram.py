@@ -1,50 +1,79 @@
 """Audio transcription service using Deepgram."""
 
 import logging
+import queue
+import threading
 from pathlib import Path
-
-from deepgram import DeepgramClient, FileSource, PrerecordedOptions
-
+from typing import Optional
+
+from deepgram import (
+    DeepgramClient,
+    FileSource,
+    LiveOptions,
+    LiveTranscriptionEvents,
+    PrerecordedOptions,
+)
+
+from ..constants import (
+    CHANNELS,
+    SAMPLE_RATE,
+    STREAMING_FINALIZE_TIMEOUT,
+    STREAMING_SEND_MS,
+)
 from ..exceptions import TranscriptionError
-from .base import TranscriptionBackend
+from .base import StreamingTranscriptionSession, TranscriptionBackend
 
 logger = logging.getLogger(__name__)
 
+# 16-bit PCM bytes per live send
+_SEND_CHUNK_BYTES = SAMPLE_RATE * CHANNELS * 2 * STREAMING_SEND_MS // 1000
+
 
 class DeepgramBackend(TranscriptionBackend):
     """Handles audio transcription using Deepgram."""
 
     def __init__(self):
         self.client = DeepgramClient()
+        self._options = PrerecordedOptions(
+            model="nova-3",
+            language="en-US",
+            punctuate=True,
+            smart_format=True,
+        )
+        self._custom_options = {"mip_opt_out": "true"}
+
+    def create_streaming_session(self) -> "DeepgramStreamingSession":
+        """Create a live WebSocket session that transcribes during recording."""
+        return DeepgramStreamingSession(self.client)
 
     def transcribe_file(self, audio_file_path: Path) -> str:
         """Transcribe audio file and return transcript."""
         logger.info(f"Starting Deepgram transcription of: {audio_file_path}")
 
-        exists, file_size = self._validate_audio_file(audio_file_path)
-        if not exists:
+        # Reading directly answers both existence and emptiness
+        try:
+            buffer = audio_file_path.read_bytes()
+        except FileNotFoundError:
             raise TranscriptionError(f"Audio file does not exist: {audio_file_path}")
-        if file_size == 0:
-            raise TranscriptionError("Audio file is empty")
+        except OSError as e:
+            raise TranscriptionError(f"Failed to read audio file: {e}")
 
-        try:
-            options = PrerecordedOptions(
-                model="nova-3",
-                language="en-US",
-                punctuate=True,
-                smart_format=True,
-            )
+        if not buffer:
+            raise TranscriptionError("Audio file is empty")
 
-            custom_options = {"mip_opt_out": "true"}
+        return self.transcribe_audio(buffer)
 
-            with open(audio_file_path, "rb") as audio_file:
-                buffer = audio_file.read()
+    def transcribe_audio(self, audio_data: bytes) -> str:
+        """Transcribe in-memory WAV data and return transcript."""
+        if not audio_data:
+            raise TranscriptionError("Audio data is empty")
 
-            payload: FileSource = {"buffer": buffer}
+        try:
+            payload: FileSource = {"buffer": audio_data}
 
-            logger.info("Sending audio to Deepgram")
+            logger.info(f"Sending {len(audio_data)} bytes of audio to Deepgram")
             response = self.client.listen.rest.v("1").transcribe_file(
-                payload, options, addons=custom_options
+                payload, self._options, addons=self._custom_options
             )
 
             return self._extract_transcript(response)
@@ -52,16 +81,6 @@ class DeepgramBackend(TranscriptionBackend):
         except Exception as e:
             raise TranscriptionError(f"Deepgram transcription failed: {e}")
 
-    def _validate_audio_file(self, audio_file_path: Path) -> tuple[bool, int]:
-        """Validate audio file exists and get size."""
-        try:
-            if not audio_file_path.exists():
-                return False, 0
-            size = audio_file_path.stat().st_size
-            return True, size
-        except OSError:
-            return False, 0
-
     def _extract_transcript(self, response) -> str:
         """Extract transcript from Deepgram response."""
         if not (response.results and response.results.channels):
@@ -82,3 +101,146 @@ class DeepgramBackend(TranscriptionBackend):
         cleaned_transcript = transcript.strip()
 
         return cleaned_transcript
+
+
+class DeepgramStreamingSession(StreamingTranscriptionSession):
+    """Streams recorded audio to Deepgram's live WebSocket API."""
+
+    def __init__(self, client: DeepgramClient):
+        self.client = client
+        self.connection = None
+        self._audio_queue: queue.Queue[Optional[bytes]] = queue.Queue()
+        self._sender_thread: Optional[threading.Thread] = None
+        self._segments: list[str] = []
+        self._finalized = threading.Event()
+        self._error: Optional[str] = None
+
+    def start(self) -> None:
+        """Open the WebSocket connection and start forwarding queued audio."""
+        logger.info("Opening Deepgram live transcription connection")
+
+        connection = self.client.listen.websocket.v("1")
+        connection.on(LiveTranscriptionEvents.Transcript, self._on_transcript)
+        connection.on(LiveTranscriptionEvents.Error, self._on_error)
+        connection.on(LiveTranscriptionEvents.Close, self._on_close)
+
+        options = LiveOptions(
+            model="nova-3",
+            language="en-US",
+            punctuate=True,
+            smart_format=True,
+            encoding="linear16",
+            sample_rate=SAMPLE_RATE,
+            channels=CHANNELS,
+        )
+
+        try:
+            started = connection.start(options, addons={"mip_opt_out": "true"})
+        except Exception as e:
+            raise TranscriptionError(f"Failed to open Deepgram live connection: {e}")
+        if not started:
+            raise TranscriptionError("Failed to open Deepgram live connection")
+
+        self.connection = connection
+
+        # Network sends happen here, never on the audio capture thread
+        self._sender_thread = threading.Thread(target=self._send_loop, daemon=True)
+        self._sender_thread.start()
+        logger.info("Deepgram live transcription connection opened")
+
+    def send_audio(self, audio_data: bytes) -> None:
+        """Queue raw PCM audio to be sent to Deepgram."""
+        self._audio_queue.put(audio_data)
+
+    def _send_loop(self) -> None:
+        """Forward queued audio to the WebSocket until the end marker arrives.
+
+        Capture callbacks deliver short buffers, so audio is batched into
+        larger frames to cut per-message overhead. Whatever is left when the
+        end marker arrives is sent before the loop exits.
+        """
+        pending = bytearray()
+        while (audio_data := self._audio_queue.get()) is not None:
+            pending += audio_data
+            if len(pending) >= _SEND_CHUNK_BYTES:
+                self._send(bytes(pending))
+                pending.clear()
+
+        if pending:
+            self._send(bytes(pending))
+
+    def _send(self, audio_data: bytes) -> None:
+        """Send one frame of audio, logging rather than raising on failure."""
+        try:
+            self.connection.send(audio_data)
+        except Exception as e:
+            logger.error(f"Error sending audio to Deepgram: {e}")
+
+    def finish(self) -> str:
+        """Flush remaining audio, wait for the final result and close."""
+        if not self.connection:
+            raise TranscriptionError("Deepgram live connection was not started")
+
+        try:
+            self._stop_sender()
+
+            # Finalize flushes Deepgram's buffer; the response is flagged
+            # from_finalize so we know every final segment has arrived
+            self.connection.finalize()
+            if not self._finalized.wait(STREAMING_FINALIZE_TIMEOUT):
+                raise TranscriptionError(
+                    "Timed out waiting for final Deepgram live transcript"
+                )
+            if self._error:
+                raise TranscriptionError(
+                    f"Deepgram live transcription failed: {self._error}"
+                )
+
+            transcript = " ".join(self._segments).strip()
+            logger.info(
+                f"Deepgram live transcription completed, length: {len(transcript)} chars"
+            )
+            return transcript
+
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Close the WebSocket connection without waiting for results."""
+        self._stop_sender()
+
+        if self.connection:
+            try:
+                self.connection.finish()
+            except Exception as e:
+                logger.warning(f"Error closing Deepgram live connection: {e}")
+            self.connection = None
+
+    def _stop_sender(self) -> None:
+        """Send any queued audio and stop the sender thread."""
+        if self._sender_thread:
+            self._audio_queue.put(None)
+            self._sender_thread.join()
+            self._sender_thread = None
+
+    def _on_transcript(self, _connection, result, **kwargs) -> None:
+        """Collect final transcript segments."""
+        if result.is_final and result.channel.alternatives:
+            segment = result.channel.alternatives[0].transcript.strip()
+            if segment:
+                self._segments.append(segment)
+
+        if result.from_finalize:
+            self._finalized.set()
+
+    def _on_error(self, _connection, error=None, **kwargs) -> None:
+        """Record a live transcription error and unblock finish()."""
+        logger.error(f"Deepgram live transcription error: {error}")
+        self._error = str(error)
+        self._finalized.set()
+
+    def _on_close(self, _connection, *args, **kwargs) -> None:
+        """Unblock finish() if the server closes the connection early."""
+        if not self._finalized.is_set():
+            self._error = "connection closed before final transcript"
+            self._finalized.set()
@@ -2,6 +2,8 @@
 
 import logging
 import platform
+import re
+import shutil
 import subprocess
 from abc import ABC, abstractmethod
 from typing import Optional
@@ -11,6 +13,29 @@ from .exceptions import WindowDetectionError
 
 logger = logging.getLogger(__name__)
 
+# Properties read from xprop, and the "NAME(TYPE) = value" lines it prints
+_XPROP_ATOMS = ("WM_CLASS", "_NET_WM_NAME", "WM_NAME", "_NET_WM_PID")
+_XPROP_LINE = re.compile(r"^(\w+)\([^)]*\) = (.*)$", re.MULTILINE)
+
+# Common Chrome/Chromium identifiers; "chrome", "brave" and "edge" also cover
+# google-chrome, brave-browser, microsoft-edge and the like
+_CHROME_IDENTIFIERS = re.compile(r"chrome|chromium|brave|edge", re.IGNORECASE)
+
+# Returns "app|title|pid" for the frontmost application in one osascript run
+_FRONTMOST_APP_SCRIPT = """
+tell application "System Events"
+    set frontApp to first application process whose frontmost is true
+    set appName to name of frontApp
+    set appPid to unix id of frontApp
+    try
+        set windowTitle to title of front window of frontApp
+    on error
+        set windowTitle to ""
+    end try
+end tell
+return appName & "|" & windowTitle & "|" & appPid
+"""
+
 
 class WindowDetectionBackend(ABC):
     """Abstract base class for platform-specific window detection."""
@@ -32,31 +57,119 @@ class WindowDetectionBackend(ABC):
 
 
 class LinuxWindowDetector(WindowDetectionBackend):
-    """Linux window detection using xdotool and xprop."""
+    """Linux window detection using Xlib, with xdotool and xprop as fallback."""
+
+    def __init__(self):
+        """Initialize Linux window detector."""
+        # Resolve the helper tools once so a missing one fails fast
+        self._xdotool = shutil.which("xdotool")
+        self._xprop = shutil.which("xprop")
+
+        # One X connection answers every query without spawning processes
+        try:
+            from Xlib import X, display, error
+
+            self._display = display.Display()
+            self._any_property_type = X.AnyPropertyType
+            self._xlib_error = error.XError
+            self._net_wm_name = self._display.intern_atom("_NET_WM_NAME")
+            self._net_wm_pid = self._display.intern_atom("_NET_WM_PID")
+        except Exception as e:
+            logger.warning(f"X11 connection unavailable, falling back to xprop: {e}")
+            self._display = None
 
     def get_focused_window_info(self) -> dict[str, str]:
         """Get information about the currently focused window on Linux."""
+        if self._display is not None:
+            return self._get_window_info_xlib()
+        else:
+            return self._get_window_info_xprop()
+
+    def _get_window_info_xlib(self) -> dict[str, str]:
+        """Get window info over the X connection."""
         try:
-            # Get the focused window ID
-            window_id = self._get_focused_window_id()
+            window = self._display.get_input_focus().focus
+            if isinstance(window, int):
+                # X.NONE or X.PointerRoot: no window has focus
+                raise WindowDetectionError("No window has input focus")
+
+            # Focus often sits on a child of the client window; walk up to
+            # the window that carries WM_CLASS
+            wm_class = window.get_wm_class()
+            while wm_class is None:
+                parent = window.query_tree().parent
+                if not parent or parent == self._display.screen().root:
+                    break
+                window = parent
+                wm_class = window.get_wm_class()
+
+            window_class = wm_class[0] if wm_class else ""
+            window_name = self._get_text_property(window, self._net_wm_name)
+            if window_name is None:
+                window_name = window.get_wm_name() or ""
+
+            pid_property = window.get_full_property(
+                self._net_wm_pid, self._any_property_type
+            )
+            window_pid = str(pid_property.value[0]) if pid_property else ""
 
-            # Get window class
-            window_class = self._get_window_property(window_id, "WM_CLASS")
+            logger.debug(
+                f"Detected window - Class: {window_class}, Name: {window_name}, PID: {window_pid}"
+            )
 
-            # Get window name/title
-            window_name = self._get_window_property(window_id, "WM_NAME")
+            return {
+                "class": window_class,
+                "name": window_name,
+                "pid": window_pid,
+            }
 
-            # Get process ID
-            window_pid = self._get_window_property(window_id, "_NET_WM_PID")
+        except WindowDetectionError:
+            raise
+        except self._xlib_error as e:
+            logger.error(f"Failed to get window information via Xlib: {e}")
+            raise WindowDetectionError(f"Unable to detect focused window: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error in Xlib window detection: {e}")
+            raise WindowDetectionError(f"Window detection failed: {e}")
+
+    def _get_text_property(self, window, atom: int) -> Optional[str]:
+        """Read a UTF-8 text property from a window, if set."""
+        text_property = window.get_full_property(atom, self._any_property_type)
+        if not text_property:
+            return None
+
+        value = text_property.value
+        if isinstance(value, bytes):
+            return value.decode("utf-8", errors="replace")
+        return str(value)
+
+    def _get_window_info_xprop(self) -> dict[str, str]:
+        """Get window info by running xdotool and xprop."""
+        if not (self._xdotool and self._xprop):
+            raise WindowDetectionError(
+                "xdotool and xprop are required for window detection"
+            )
+
+        try:
+            # Get the focused window ID
+            window_id = self._get_focused_window_id()
+
+            # Fetch class, title and PID with a single xprop call
+            properties = self._get_window_properties(window_id)
+            window_class = properties.get("WM_CLASS", "")
+            window_name = properties.get("_NET_WM_NAME") or properties.get(
+                "WM_NAME", ""
+            )
+            window_pid = properties.get("_NET_WM_PID", "")
 
             logger.debug(
                 f"Detected window - Class: {window_class}, Name: {window_name}, PID: {window_pid}"
             )
 
             return {
-                "class": window_class or "",
-                "name": window_name or "",
-                "pid": window_pid or "",
+                "class": window_class,
+                "name": window_name,
+                "pid": window_pid,
             }
 
         except subprocess.CalledProcessError as e:
@@ -69,52 +182,40 @@ class LinuxWindowDetector(WindowDetectionBackend):
     def _get_focused_window_id(self) -> str:
         """Get the ID of the currently focused window."""
         result = subprocess.run(
-            ["xdotool", "getwindowfocus"],
-            capture_output=True,
+            [self._xdotool, "getwindowfocus"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             check=True,
             timeout=XDOTOOL_TIMEOUT,
         )
         return result.stdout.strip()
 
-    def _get_window_property(self, window_id: str, property_name: str) -> Optional[str]:
-        """Get a specific property of a window."""
-        try:
-            result = subprocess.run(
-                ["xdotool", "getwindowname", window_id]
-                if property_name == "WM_NAME"
-                else ["xprop", "-id", window_id, property_name],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=XDOTOOL_TIMEOUT,
-            )
+    def _get_window_properties(self, window_id: str) -> dict[str, str]:
+        """Get the window properties used for detection, keyed by atom name.
+
+        Properties the window does not set are left out.
+        """
+        result = subprocess.run(
+            [self._xprop, "-id", window_id, *_XPROP_ATOMS],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=True,
+            timeout=XDOTOOL_TIMEOUT,
+        )
+
+        properties = {}
+        for name, value in _XPROP_LINE.findall(result.stdout):
+            value = value.strip()
+            if name == "WM_CLASS":
+                # WM_CLASS returns something like '"Google-chrome", "Google-chrome"'
+                value = value.strip('"').split('"')[0] if '"' in value else value
+            elif value.startswith('"') and value.endswith('"'):
+                value = value[1:-1].replace('\\"', '"')
+            properties[name] = value
 
-            if property_name == "WM_NAME":
-                return result.stdout.strip()
-            else:
-                # Parse xprop output
-                output = result.stdout.strip()
-                if "=" in output:
-                    value = output.split("=", 1)[1].strip()
-                    # Clean up quoted strings and extract first class name for WM_CLASS
-                    if property_name == "WM_CLASS" and value:
-                        # WM_CLASS returns something like '"Google-chrome", "Google-chrome"'
-                        value = (
-                            value.strip('"').split('"')[0] if '"' in value else value
-                        )
-                    elif property_name == "_NET_WM_PID":
-                        # PID is just a number
-                        value = value.strip()
-                    return value
-
-        except subprocess.CalledProcessError:
-            # Property might not exist for this window
-            pass
-        except subprocess.TimeoutExpired:
-            logger.warning(f"Timeout getting window property {property_name}")
-
-        return None
+        return properties
 
 
 class MacOSWindowDetector(WindowDetectionBackend):
@@ -123,23 +224,28 @@ class MacOSWindowDetector(WindowDetectionBackend):
     def get_focused_window_info(self) -> dict[str, str]:
         """Get information about the currently focused window on macOS."""
         try:
-            # Get the frontmost application name
-            app_name = self._get_frontmost_app_name()
-
-            # Get the frontmost window title
-            window_title = self._get_frontmost_window_title()
+            # Fetch app name, window title and PID with a single osascript call
+            result = subprocess.run(
+                ["osascript", "-e", _FRONTMOST_APP_SCRIPT],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                check=True,
+                timeout=XDOTOOL_TIMEOUT,
+            )
 
-            # Get process ID (simplified - just use app name as identifier)
-            pid = self._get_frontmost_app_pid()
+            # Titles may contain the separator, so split from both ends
+            app_name, _, rest = result.stdout.strip().partition("|")
+            window_title, _, pid = rest.rpartition("|")
 
             logger.debug(
                 f"Detected window - App: {app_name}, Title: {window_title}, PID: {pid}"
             )
 
             return {
-                "class": app_name or "",
-                "name": window_title or "",
-                "pid": str(pid) if pid else "",
+                "class": app_name,
+                "name": window_title,
+                "pid": pid if pid.isdigit() else "",
             }
 
         except subprocess.CalledProcessError as e:
@@ -149,60 +255,6 @@ class MacOSWindowDetector(WindowDetectionBackend):
             logger.error(f"Unexpected error in window detection: {e}")
             raise WindowDetectionError(f"Window detection failed: {e}")
 
-    def _get_frontmost_app_name(self) -> Optional[str]:
-        """Get the name of the frontmost application."""
-        try:
-            result = subprocess.run(
-                [
-                    "osascript",
-                    "-e",
-                    'tell application "System Events" to get name of first application process whose frontmost is true',
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=XDOTOOL_TIMEOUT,
-            )
-            return result.stdout.strip()
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
-            return None
-
-    def _get_frontmost_window_title(self) -> Optional[str]:
-        """Get the title of the frontmost window."""
-        try:
-            result = subprocess.run(
-                [
-                    "osascript",
-                    "-e",
-                    'tell application "System Events" to get title of front window of first application process whose frontmost is true',
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=XDOTOOL_TIMEOUT,
-            )
-            return result.stdout.strip()
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
-            return None
-
-    def _get_frontmost_app_pid(self) -> Optional[int]:
-        """Get the PID of the frontmost application."""
-        try:
-            result = subprocess.run(
-                [
-                    "osascript",
-                    "-e",
-                    'tell application "System Events" to get unix id of first application process whose frontmost is true',
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=XDOTOOL_TIMEOUT,
-            )
-            return int(result.stdout.strip())
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, ValueError):
-            return None
-
 
 class WindowsWindowDetector(WindowDetectionBackend):
     """Windows window detection using Win32 API."""
@@ -216,7 +268,7 @@ class WindowsWindowDetector(WindowDetectionBackend):
             self._win32gui = win32gui
             self._win32process = win32process
         except ImportError:
-            logger.warning("pywin32 not available, falling back to PowerShell")
+            logger.warning("pywin32 not available, falling back to ctypes")
             self._win32gui = None
             self._win32process = None
 
@@ -225,7 +277,7 @@ class WindowsWindowDetector(WindowDetectionBackend):
         if self._win32gui and self._win32process:
             return self._get_window_info_win32()
         else:
-            return self._get_window_info_powershell()
+            return self._get_window_info_ctypes()
 
     def _get_window_info_win32(self) -> dict[str, str]:
         """Get window info using Win32 API."""
@@ -256,69 +308,55 @@ class WindowsWindowDetector(WindowDetectionBackend):
             logger.error(f"Failed to get window information via Win32: {e}")
             raise WindowDetectionError(f"Unable to detect focused window: {e}")
 
-    def _get_window_info_powershell(self) -> dict[str, str]:
-        """Get window info using PowerShell as fallback."""
+    def _get_window_info_ctypes(self) -> dict[str, str]:
+        """Get window info by calling user32 through ctypes as fallback."""
         try:
-            # PowerShell script to get active window info
-            ps_script = """
-            Add-Type @"
-                using System;
-                using System.Runtime.InteropServices;
-                using System.Text;
-                public class Win32 {
-                    [DllImport("user32.dll")]
-                    public static extern IntPtr GetForegroundWindow();
-                    [DllImport("user32.dll")]
-                    public static extern int GetWindowText(IntPtr hWnd, StringBuilder text, int count);
-                    [DllImport("user32.dll")]
-                    public static extern int GetClassName(IntPtr hWnd, StringBuilder text, int count);
-                    [DllImport("user32.dll")]
-                    public static extern uint GetWindowThreadProcessId(IntPtr hWnd, out uint processId);
-                }
-"@
-            $hwnd = [Win32]::GetForegroundWindow()
-            $title = New-Object System.Text.StringBuilder 256
-            $class = New-Object System.Text.StringBuilder 256
-            [Win32]::GetWindowText($hwnd, $title, 256)
-            [Win32]::GetClassName($hwnd, $class, 256)
-            $pid = 0
-            [Win32]::GetWindowThreadProcessId($hwnd, [ref]$pid)
-            Write-Output "$($class.ToString())|$($title.ToString())|$pid"
-            """
+            import ctypes
+            from ctypes import wintypes
+
+            user32 = ctypes.WinDLL("user32", use_last_error=True)
+            user32.GetForegroundWindow.restype = wintypes.HWND
+            user32.GetWindowTextW.argtypes = [
+                wintypes.HWND,
+                wintypes.LPWSTR,
+                ctypes.c_int,
+            ]
+            user32.GetClassNameW.argtypes = [
+                wintypes.HWND,
+                wintypes.LPWSTR,
+                ctypes.c_int,
+            ]
+            user32.GetWindowThreadProcessId.argtypes = [
+                wintypes.HWND,
+                ctypes.POINTER(wintypes.DWORD),
+            ]
 
-            result = subprocess.run(
-                ["powershell", "-Command", ps_script],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=XDOTOOL_TIMEOUT * 2,  # PowerShell might be slower
-            )
+            # Get the foreground window handle
+            hwnd = user32.GetForegroundWindow()
 
-            output = result.stdout.strip()
-            if "|" in output:
-                parts = output.split("|", 2)
-                window_class = parts[0] if len(parts) > 0 else ""
-                window_title = parts[1] if len(parts) > 1 else ""
-                window_pid = parts[2] if len(parts) > 2 else ""
+            # Get window title and class name
+            title = ctypes.create_unicode_buffer(256)
+            user32.GetWindowTextW(hwnd, title, len(title))
+            class_name = ctypes.create_unicode_buffer(256)
+            user32.GetClassNameW(hwnd, class_name, len(class_name))
 
-                logger.debug(
-                    f"Detected window - Class: {window_class}, Title: {window_title}, PID: {window_pid}"
-                )
+            # Get process ID
+            pid = wintypes.DWORD()
+            user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
 
-                return {
-                    "class": window_class,
-                    "name": window_title,
-                    "pid": window_pid,
-                }
+            logger.debug(
+                f"Detected window - Class: {class_name.value}, Title: {title.value}, PID: {pid.value}"
+            )
 
-            raise WindowDetectionError("Invalid PowerShell output format")
+            return {
+                "class": class_name.value,
+                "name": title.value,
+                "pid": str(pid.value) if pid.value else "",
+            }
 
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to get window information via PowerShell: {e}")
-            raise WindowDetectionError(f"Unable to detect focused window: {e}")
         except Exception as e:
-            logger.error(f"Unexpected error in PowerShell window detection: {e}")
-            raise WindowDetectionError(f"Window detection failed: {e}")
+            logger.error(f"Failed to get window information via ctypes: {e}")
+            raise WindowDetectionError(f"Unable to detect focused window: {e}")
 
 
 class WindowDetector:
@@ -371,25 +409,13 @@ class WindowDetector:
         """
         try:
             window_info = self.get_focused_window_info()
-            window_class = window_info.get("class", "").lower()
-            window_name = window_info.get("name", "").lower()
-
-            # Check for common Chrome/Chromium identifiers
-            chrome_identifiers = [
-                "google-chrome",
-                "chromium",
-                "chrome",
-                "google chrome",
-                "brave-browser",
-                "microsoft-edge",
-                "edge",
-                "brave",
-            ]
+            window_class = window_info.get("class", "")
+            window_name = window_info.get("name", "")
 
-            for identifier in chrome_identifiers:
-                if identifier in window_class or identifier in window_name:
-                    logger.debug(f"Chrome-based browser detected: {window_class}")
-                    return True
+            # Check class and title for common Chrome/Chromium identifiers
+            if _CHROME_IDENTIFIERS.search(f"{window_class}\n{window_name}"):
+                logger.debug(f"Chrome-based browser detected: {window_class}")
+                return True
 
             return False
 
@@ -44,11 +44,16 @@ def main() -> None:
         default="deepgram",
         help="Transcription backend to use (default: deepgram)",
     )
+    parser.add_argument(
+        "--keep-audio",
+        action="store_true",
+        help="Also save the recording to /tmp/dictator_recording.wav",
+    )
 
     args = parser.parse_args()
     logger.info(f"Executing command: {args.command} with backend: {args.backend}")
 
-    app = DictatorApp(backend=args.backend)
+    app = DictatorApp(backend=args.backend, keep_audio_file=args.keep_audio)
 
     try:
         if args.command == "begin":